@@ -1,8 +1,12 @@
+import sys
 import time
 from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import wait as wait_futures
+from functools import cache
 from typing import Any, Unpack
 
-from halo import Halo  # pyright: ignore[reportMissingTypeStubs]
+import requests
 from loguru import logger
 from notte_core.common.notifier import BaseNotifier
 from notte_core.utils.webp_replay import WebpReplay
@@ -18,6 +22,7 @@ from notte_sdk.types import (
     AgentListRequest,
     AgentListRequestDict,
     AgentResponse,
+    AgentRunRequest,
     AgentRunRequestDict,
     AgentStartRequest,
     AgentStartRequestDict,
@@ -36,6 +41,14 @@ class _AgentResponse(BaseModel):
 
 AgentStatusResponse = _AgentStatusResponse[_AgentResponse]
 
+MAX_CONCURRENT_AGENTS = 16
+
+
+@cache
+def _agents_executor() -> ThreadPoolExecutor:
+    # shared by all clients so that concurrent agent runs are bounded process-wide
+    return ThreadPoolExecutor(max_workers=MAX_CONCURRENT_AGENTS, thread_name_prefix="notte-agents")
+
 
 @final
 class AgentsClient(BaseClient):
@@ -58,6 +71,7 @@ class AgentsClient(BaseClient):
         self,
         api_key: str | None = None,
         verbose: bool = False,
+        http: requests.Session | None = None,
     ):
         """
         Initialize an AgentsClient instance.
@@ -67,7 +81,7 @@ class AgentsClient(BaseClient):
         Args:
             api_key: Optional API key for authenticating requests.
         """
-        super().__init__(base_endpoint_path="agents", api_key=api_key, verbose=verbose)
+        super().__init__(base_endpoint_path="agents", api_key=api_key, verbose=verbose, http=http)
 
     @staticmethod
     def agent_start_endpoint() -> NotteEndpoint[AgentResponse]:
@@ -144,19 +158,20 @@ class AgentsClient(BaseClient):
 
     @override
     @staticmethod
+    @cache
     def endpoints() -> Sequence[NotteEndpoint[BaseModel]]:
         """
         Returns a list of endpoints for agent operations.
 
         Aggregates endpoints for running, stopping, checking status, and listing agents.
         """
-        return [
+        return (
             AgentsClient.agent_start_endpoint(),
             AgentsClient.agent_stop_endpoint(),
             AgentsClient.agent_status_endpoint(),
             AgentsClient.agent_list_endpoint(),
             AgentsClient.agent_replay_endpoint(),
-        ]
+        )
 
     def start(self, **data: Unpack[AgentStartRequestDict]) -> AgentResponse:
         """
@@ -172,8 +187,19 @@ class AgentsClient(BaseClient):
             AgentResponse: The response obtained from the agent run request.
         """
         request = AgentStartRequest.model_validate(data)
-        response = self.request(AgentsClient.agent_start_endpoint().with_request(request))
-        return response
+        return self.start_with_request(request)
+
+    def start_with_request(self, request: AgentStartRequest) -> AgentResponse:
+        """
+        Start an agent from an already validated request.
+
+        Args:
+            request: The agent start request.
+
+        Returns:
+            AgentResponse: The response obtained from the agent run request.
+        """
+        return self.request(AgentsClient.agent_start_endpoint().with_request(request))
 
     @staticmethod
     def pretty_string(step: _AgentResponse, colors: bool = True) -> list[tuple[str, dict[str, str]]]:
@@ -209,6 +235,12 @@ class AgentsClient(BaseClient):
             AgentStatusResponse: The response from the agent status check.
         """
         last_step = 0
+        # only show a spinner on interactive terminals: the answer is invariant across polls
+        spinner = None
+        if sys.stdout.isatty() and not WebpReplay.in_notebook():
+            from halo import Halo  # pyright: ignore[reportMissingTypeStubs]
+
+            spinner = Halo()
         for _ in range(max_attempts):
             response = self.status(agent_id=agent_id)
             if len(response.steps) > last_step:
@@ -222,12 +254,9 @@ class AgentsClient(BaseClient):
             if response.status == AgentStatus.closed:
                 return response
 
-            spinner = None
             try:
-                if not WebpReplay.in_notebook():
-                    spinner = Halo(
-                        text=f"Waiting {polling_interval_seconds} seconds for agent to complete (current step: {last_step})...",
-                    )
+                if spinner is not None:
+                    spinner.text = f"Waiting {polling_interval_seconds} seconds for agent to complete (current step: {last_step})..."
                 time.sleep(polling_interval_seconds)
 
             finally:
@@ -269,6 +298,53 @@ class AgentsClient(BaseClient):
         # wait for completion
         return self.wait(agent_id=response.agent_id)
 
+    def run_many(self, datas: Sequence[AgentStartRequestDict]) -> list[AgentStatusResponse]:
+        """
+        Run several agents concurrently and wait for all of them to complete.
+
+        Agents are started from a shared thread pool, then each one is waited for on a thread of its own
+        (for the duration of this call), so that long runs never hold up other agents' starts.
+
+        If any agent fails to start or to complete, the agents that did start and are not done yet are
+        stopped before the error is raised, so that none keeps running remotely unattended.
+
+        Args:
+            datas: The request parameters of each agent to run.
+
+        Returns:
+            list[AgentStatusResponse]: The final status of each agent, in the same order as `datas`.
+        """
+        executor = _agents_executor()
+        starts: dict[Future[AgentResponse], int] = {
+            executor.submit(self.start, **data): idx for idx, data in enumerate(datas)
+        }
+        # a wait blocks for a whole agent run: keep them off the shared pool, which only serves the short starts
+        waiter = ThreadPoolExecutor(max_workers=max(len(starts), 1), thread_name_prefix="notte-agents-wait")
+        waits: dict[Future[AgentStatusResponse], int] = {}
+        results: dict[int, AgentStatusResponse] = {}
+        try:
+            for future in as_completed(starts):
+                response = future.result()
+                waits[waiter.submit(self.wait, agent_id=response.agent_id)] = starts[future]
+            for future in as_completed(waits):
+                results[waits[future]] = future.result()
+        except Exception:
+            # starts still in flight may yet succeed: settle them before cleaning up
+            _ = wait_futures(starts)
+            for future, idx in starts.items():
+                if idx in results or future.exception() is not None:
+                    continue
+                agent_id = future.result().agent_id
+                try:
+                    _ = self.stop(agent_id=agent_id)
+                except Exception as e:
+                    logger.warning(f"Failed to stop agent {agent_id} after a failed batch run: {e}")
+            raise
+        finally:
+            # don't block on the failure path: waits of stopped agents return once the agents are closed
+            waiter.shutdown(wait=False, cancel_futures=True)
+        return [results[idx] for idx in range(len(starts))]
+
     def status(self, agent_id: str) -> AgentStatusResponse:
         """
         Retrieves the status of the specified agent.
@@ -365,11 +441,16 @@ class RemoteAgent:
             raise ValueError("You need to run the agent first to get the agent id")
         return self.response.agent_id
 
-    def start(self, **data: Unpack[AgentStartRequestDict]) -> AgentResponse:
+    def _start_request(self, data: AgentRunRequestDict) -> AgentStartRequest:
+        # `self.request` is already validated: only the run parameters need validation
+        run_request = AgentRunRequest.model_validate(data)
+        return AgentStartRequest.model_construct(**self.request.__dict__, **run_request.__dict__)
+
+    def start(self, **data: Unpack[AgentRunRequestDict]) -> AgentResponse:
         """
         Start the agent with the specified request parameters.
         """
-        self.response = self.client.start(**self.request.model_dump(), **data)
+        self.response = self.client.start_with_request(self._start_request(data))
         return self.response
 
     def wait(self) -> AgentStatusResponse:
@@ -399,7 +480,7 @@ class RemoteAgent:
             AgentResponse: The response from the completed agent execution.
         """
 
-        self.response = self.client.start(**self.request.model_dump(), **data)
+        self.response = self.client.start_with_request(self._start_request(data))
         return self.client.wait(agent_id=self.agent_id)
 
     async def arun(self, **data: Unpack[AgentRunRequestDict]) -> AgentStatusResponse:
@@ -1,18 +1,28 @@
 import os
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, replace
+from functools import cache, partial
 from typing import Any, ClassVar, Generic, Literal, Self, TypeVar
 
+import orjson
 import requests
 from loguru import logger
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from notte_sdk.errors import AuthenticationError, NotteAPIError, NotteAPIExecutionError
 
 TResponse = TypeVar("TResponse", bound=BaseModel, covariant=True)
 
 
-class NotteEndpoint(BaseModel, Generic[TResponse]):
+@cache
+def _list_adapter(model: type[TResponse]) -> TypeAdapter[list[TResponse]]:
+    """Return a (cached) adapter validating a whole list of `model` items in a single pydantic-core call."""
+    return TypeAdapter(list[model])  # pyright: ignore[reportInvalidTypeForm]
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class NotteEndpoint(Generic[TResponse]):
     path: str
     response: type[TResponse]
     request: BaseModel | None = None
@@ -20,9 +30,8 @@ class NotteEndpoint(BaseModel, Generic[TResponse]):
     params: BaseModel | None = None
 
     def with_request(self, request: BaseModel) -> Self:
-        # return deep copy of self with the request set
         """
-        Return a deep copy of the endpoint with the specified request.
+        Return a copy of the endpoint with the specified request.
 
         Creates a new instance of the endpoint with its request attribute updated to the provided model.
         The original instance remains unmodified.
@@ -33,10 +42,9 @@ class NotteEndpoint(BaseModel, Generic[TResponse]):
         Returns:
             A new endpoint instance with the updated request.
         """
-        return self.model_copy(update={"request": request})
+        return replace(self, request=request)
 
     def with_params(self, params: BaseModel) -> Self:
-        # return deep copy of self with the params set
         """
         Return a new endpoint instance with updated parameters.
 
@@ -46,7 +54,7 @@ class NotteEndpoint(BaseModel, Generic[TResponse]):
         Args:
             params: A Pydantic model instance containing the new parameters.
         """
-        return self.model_copy(update={"params": params})
+        return replace(self, params=params)
 
 
 class BaseClient(ABC):
@@ -58,6 +66,7 @@ class BaseClient(ABC):
         base_endpoint_path: str | None,
         api_key: str | None = None,
         verbose: bool = False,
+        http: requests.Session | None = None,
     ):
         """
         Initialize a new API client instance.
@@ -72,6 +81,8 @@ class BaseClient(ABC):
             base_endpoint_path: Optional base path to be prefixed to endpoint URLs.
             api_key: Optional API key for authentication; if not supplied, retrieved from
                 the NOTTE_API_KEY environment variable.
+            http: Optional HTTP session to share a connection pool with other clients; a new
+                session is created if not supplied.
 
         Raises:
             AuthenticationError: If an API key is neither provided nor available in the environment.
@@ -88,6 +99,30 @@ class BaseClient(ABC):
         }
         self.base_endpoint_path: str | None = base_endpoint_path
         self.verbose: bool = verbose
+        # keep-alive connection pool shared by every request issued by this client
+        self._http: requests.Session = http or requests.Session()
+        # a session handed over by the caller is owned (and closed) by the caller
+        self._owns_http: bool = http is None
+        self._dispatch: dict[str, Callable[..., requests.Response]] = {
+            "GET": partial(self._http.get, timeout=self.DEFAULT_REQUEST_TIMEOUT_SECONDS),
+            "POST": partial(self._http.post, timeout=self.DEFAULT_REQUEST_TIMEOUT_SECONDS),
+            "DELETE": partial(self._http.delete, timeout=self.DEFAULT_REQUEST_TIMEOUT_SECONDS),
+        }
+
+    def close(self) -> None:
+        """
+        Release the client's pooled HTTP connections.
+
+        A no-op when the HTTP session was provided by the caller, which remains responsible for closing it.
+        """
+        if self._owns_http:
+            self._http.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
 
     @staticmethod
     @abstractmethod
@@ -124,21 +159,21 @@ class BaseClient(ABC):
             return f"{self.server_url}/{endpoint.path}"
         return f"{self.server_url}/{self.base_endpoint_path}/{endpoint.path}"
 
-    def _request(self, endpoint: NotteEndpoint[TResponse]) -> requests.Response:
+    def _send(self, endpoint: NotteEndpoint[TResponse]) -> requests.Response:
         """
         Executes an HTTP request for the given API endpoint.
 
         Constructs the full URL and headers from the endpoint's configuration and issues an HTTP
         request using the specified method (GET, POST, or DELETE). For POST requests, a request model
-        must be provided; otherwise, a ValueError is raised. If the response status code is not 200 or
-        the JSON response contains an error detail, a NotteAPIError is raised.
+        must be provided; otherwise, a ValueError is raised. If the response status code is not 200,
+        a NotteAPIError is raised.
 
         Args:
             endpoint: An API endpoint instance containing the HTTP method, path, optional request model,
                 and query parameters.
 
         Returns:
-            The JSON-decoded response from the API.
+            The raw (successful) HTTP response.
 
         Raises:
             ValueError: If a POST request is attempted without a request model.
@@ -149,41 +184,43 @@ class BaseClient(ABC):
         params = endpoint.params.model_dump() if endpoint.params is not None else None
         if self.verbose:
             logger.info(f"Making `{endpoint.method}` request to `{endpoint.path} (i.e `{url}`) with params `{params}`.")
-        match endpoint.method:
-            case "GET":
-                response = requests.get(
-                    url=url,
-                    headers=headers,
-                    params=params,
-                    timeout=self.DEFAULT_REQUEST_TIMEOUT_SECONDS,
-                )
-            case "POST":
-                if endpoint.request is None:
-                    raise ValueError("Request model is required for POST requests")
-                response = requests.post(
-                    url=url,
-                    headers=headers,
-                    json=endpoint.request.model_dump(),
-                    params=params,
-                    timeout=self.DEFAULT_REQUEST_TIMEOUT_SECONDS,
-                )
-            case "DELETE":
-                response = requests.delete(
-                    url=url,
-                    headers=headers,
-                    params=params,
-                    timeout=self.DEFAULT_REQUEST_TIMEOUT_SECONDS,
-                )
+        kwargs: dict[str, Any] = {"url": url, "headers": headers, "params": params}
+        if endpoint.method == "POST":
+            if endpoint.request is None:
+                raise ValueError("Request model is required for POST requests")
+            # serialize the body straight to bytes with orjson rather than letting `requests` go through stdlib json
+            kwargs["data"] = orjson.dumps(endpoint.request.model_dump(), option=orjson.OPT_NON_STR_KEYS)
+            headers["Content-Type"] = "application/json"
+        response = self._dispatch[endpoint.method](**kwargs)
         if response.status_code != 200:
             if response.headers.get("x-error-class") == "NotteApiExecutionError":
                 raise NotteAPIExecutionError(path=f"{self.base_endpoint_path}/{endpoint.path}", response=response)
 
             raise NotteAPIError(path=f"{self.base_endpoint_path}/{endpoint.path}", response=response)
-        response_dict: Any = response.json()
-        if "detail" in response_dict:
-            raise NotteAPIError(path=f"{self.base_endpoint_path}/{endpoint.path}", response=response)
+        return response
+
+    def _decode(self, endpoint: NotteEndpoint[TResponse], response: requests.Response) -> Any:
+        """
+        Decodes a successful HTTP response, raising a NotteAPIError if it contains an error detail.
+        """
+        # decode the raw body directly: no charset sniffing and faster than stdlib json
+        response_dict: Any = orjson.loads(response.content)
+        if isinstance(response_dict, dict) and "detail" in response_dict:
+            raise NotteAPIError(
+                path=f"{self.base_endpoint_path}/{endpoint.path}", response=response, error=response_dict
+            )
         return response_dict
 
+    def _request(self, endpoint: NotteEndpoint[TResponse]) -> Any:
+        """
+        Executes an HTTP request for the given API endpoint and returns the JSON-decoded response.
+
+        Raises:
+            ValueError: If a POST request is attempted without a request model.
+            NotteAPIError: If the API response indicates a failure.
+        """
+        return self._decode(endpoint, self._send(endpoint))
+
     def request(self, endpoint: NotteEndpoint[TResponse]) -> TResponse:
         """
         Requests the specified API endpoint and returns the validated response.
@@ -203,10 +240,19 @@ class BaseClient(ABC):
         Raises:
             NotteAPIError: If the API response is not a dictionary.
         """
-        response: Any = self._request(endpoint)
-        if not isinstance(response, dict):
+        response = self._send(endpoint)
+        # fast path: validate straight from the raw bytes, without materializing an intermediate dict tree
+        # (which dominates memory on large payloads such as scraped pages). Bodies that may carry an error
+        # `detail`, or that fail validation, go through the explicit checks below.
+        if b'"detail"' not in response.content:
+            try:
+                return endpoint.response.model_validate_json(response.content)
+            except ValidationError:
+                pass
+        response_dict: Any = self._decode(endpoint, response)
+        if not isinstance(response_dict, dict):
             raise NotteAPIError(path=f"{self.base_endpoint_path}/{endpoint.path}", response=response)
-        return endpoint.response.model_validate(response)
+        return endpoint.response.model_validate(response_dict)
 
     def request_list(self, endpoint: NotteEndpoint[TResponse]) -> Sequence[TResponse]:
         # Handle the case where TResponse is a list of BaseModel
@@ -231,23 +277,29 @@ class BaseClient(ABC):
                 response_list = response_list["items"]
             if not isinstance(response_list, list):
                 raise NotteAPIError(path=f"{self.base_endpoint_path}/{endpoint.path}", response=response_list)
-        return [endpoint.response.model_validate(item) for item in response_list]  # pyright: ignore[reportUnknownVariableType]
+        return _list_adapter(endpoint.response).validate_python(response_list)
 
     def _request_file(
         self, endpoint: NotteEndpoint[TResponse], file_type: str, output_file: str | None = None
     ) -> bytes:
         url = self.request_path(endpoint)
-        response = requests.get(
+        with self._http.get(
             url=url,
-            headers=self.headers(),
+            # replays are already compressed (webp): gzipping them again only costs CPU
+            headers={**self.headers(), "Accept-Encoding": "identity"},
             timeout=self.DEFAULT_REQUEST_TIMEOUT_SECONDS,
-        )
-        if b"not found" in response.content:
+            stream=True,
+        ) as response:
+            # read the body in one go rather than through `response.content`, which collects small chunks
+            # and joins them: multi-megabyte replays would briefly be held twice in memory
+            content: bytes = response.raw.read(decode_content=True)
+        # error payloads are short messages: no need to scan the whole file for the marker
+        if b"not found" in content[:1024]:
             raise ValueError("Replay is not available.")
 
         if output_file is not None:
             if not output_file.endswith(f".{file_type}"):
                 raise ValueError(f"Output file must have a .{file_type} extension.")
             with open(output_file, "wb") as f:
-                _ = f.write(response.content)
-        return response.content
+                _ = f.write(content)
+        return content
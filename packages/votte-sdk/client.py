@@ -1,14 +1,21 @@
-from typing import Unpack
+import asyncio
+from functools import cached_property
+from typing import ClassVar, Self, Unpack
 
+import requests
 from notte_core.actions import ActionValidation
 from notte_core.data.space import DataSpace
+from pydantic import TypeAdapter, ValidationError
+from requests.adapters import HTTPAdapter
 from typing_extensions import final
 
 from notte_sdk.endpoints.agents import AgentsClient, RemoteAgentFactory
 from notte_sdk.endpoints.personas import PersonasClient
 from notte_sdk.endpoints.sessions import RemoteSessionFactory, SessionsClient
 from notte_sdk.endpoints.vaults import VaultsClient
-from notte_sdk.types import AgentResponse, ScrapeRequestDict
+from notte_sdk.types import AgentResponse, ScrapeRequestDict, StepRequest
+
+_STEPS_ADAPTER: TypeAdapter[list[ActionValidation]] = TypeAdapter(list[ActionValidation])
 
 
 @final
@@ -20,6 +27,9 @@ class NotteClient:
     If you need to handle multiple sessions, you need to create a new client for each session.
     """
 
+    HTTP_POOL_CONNECTIONS: ClassVar[int] = 4
+    HTTP_POOL_MAXSIZE: ClassVar[int] = 32
+
     def __init__(
         self,
         api_key: str | None = None,
@@ -28,21 +38,41 @@ class NotteClient:
         """Initialize a NotteClient instance.
 
         Initializes the NotteClient with the specified API key and server URL, creating instances
-        of SessionsClient, AgentsClient, VaultsClient, and PersonasClient.
+        of SessionsClient, AgentsClient, VaultsClient, and PersonasClient sharing a single HTTP
+        connection pool.
 
         Args:
             api_key: Optional API key for authentication.
         """
-        self.sessions: SessionsClient = SessionsClient(api_key=api_key, verbose=verbose)
-        self.agents: AgentsClient = AgentsClient(api_key=api_key, verbose=verbose)
-        self.personas: PersonasClient = PersonasClient(api_key=api_key, verbose=verbose)
-        self.vaults: VaultsClient = VaultsClient(api_key=api_key, verbose=verbose)
+        # all sub-clients talk to the same host: share one keep-alive connection pool between them
+        self._http: requests.Session = requests.Session()
+        self._http.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=self.HTTP_POOL_CONNECTIONS, pool_maxsize=self.HTTP_POOL_MAXSIZE, max_retries=0
+            ),
+        )
+        self.sessions: SessionsClient = SessionsClient(api_key=api_key, verbose=verbose, http=self._http)
+        self.agents: AgentsClient = AgentsClient(api_key=api_key, verbose=verbose, http=self._http)
+        self.personas: PersonasClient = PersonasClient(api_key=api_key, verbose=verbose, http=self._http)
+        self.vaults: VaultsClient = VaultsClient(api_key=api_key, verbose=verbose, http=self._http)
+
+    def close(self) -> None:
+        """Release the HTTP connection pool shared by all sub-clients."""
+        self._http.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
 
-    @property
+    # the factories only wrap the (long-lived) sub-clients: build them once per client
+    @cached_property
     def Agent(self) -> RemoteAgentFactory:
         return RemoteAgentFactory(self.agents)
 
-    @property
+    @cached_property
     def Session(self) -> RemoteSessionFactory:
         return RemoteSessionFactory(self.sessions)
 
@@ -56,13 +86,28 @@ class NotteClient:
         """
         # Step 1: get the agent status
         agent_status = self.agents.status(agent_id=agent_id)
-        # Replay each step
-        for step in agent_status.steps:
-            try:
-                action = ActionValidation.model_validate(step).action
-            except Exception as e:
-                raise ValueError(
-                    f"Agent {agent_id} contains invalid action: {step}. Please record a new agent with the same task."
-                ) from e
-            _ = self.sessions.page.step(session_id=session_id, action=action)
+        # Step 2: validate every action and build every step request before replaying anything,
+        # so that an invalid recording fails fast and the replay loop only waits on the network
+        try:
+            # validate the whole recording in a single pydantic-core call
+            validated = _STEPS_ADAPTER.validate_python(agent_status.steps)
+        except ValidationError as e:
+            invalid_step = agent_status.steps[e.errors()[0]["loc"][0]]  # pyright: ignore[reportArgumentType]
+            raise ValueError(
+                f"Agent {agent_id} contains invalid action: {invalid_step}. Please record a new agent with the same task."
+            ) from e
+        # actions were just validated: build the requests without re-running the validator on each of them
+        step_requests = [StepRequest.model_construct(action=step.action) for step in validated]
+        # Step 3: replay each step over the client's pooled connection
+        for step_request in step_requests:
+            _ = self.sessions.page.step_with_request(session_id, step_request)
         return self.agents.status(agent_id=agent_id)
+
+    async def arepeat(self, session_id: str, agent_id: str) -> AgentResponse:
+        """
+        Asynchronously repeat the agent_id action in sequence.
+
+        Steps depend on the page state left by the previous ones, so they are still replayed
+        sequentially: the replay runs in a worker thread to avoid blocking the event loop.
+        """
+        return await asyncio.to_thread(self.repeat, session_id=session_id, agent_id=agent_id)
@@ -1,3 +1,4 @@
+import random
 import time
 from functools import wraps
 from typing import Any, Callable, TypeVar
@@ -9,17 +10,26 @@ from requests import Response
 T = TypeVar("T")
 
 
+# error messages only interpolate the response body: cap it instead of decoding (possibly huge) payloads
+MAX_ERROR_BODY_LENGTH = 4096
+
+
+def _error_body(response: Response) -> str:
+    text: str | None = getattr(response, "text", None)
+    if text is None:
+        # some callers hand over an already decoded body instead of the raw response
+        return str(response)[:MAX_ERROR_BODY_LENGTH]
+    return text[:MAX_ERROR_BODY_LENGTH] if text else "<empty>"
+
+
 class NotteAPIError(NotteBaseError):
-    def __init__(self, path: str, response: Response) -> None:
-        try:
-            error = response.json()
-        except Exception:
-            if hasattr(response, "text"):
-                error = response.text
-            raise ValueError(response)
+    def __init__(self, path: str, response: Response, error: Any | None = None) -> None:
+        # `error` lets callers that already decoded the body skip re-reading it
+        if error is None:
+            error = _error_body(response)
 
         super().__init__(
-            dev_message=f"Request to `{path}` failed with status code {response.status_code}: {error}",
+            dev_message=f"Request to `{path}` failed with status code {getattr(response, 'status_code', None)}: {error}",
             user_message="An unexpected error occurred during the request to the Notte API.",
             should_notify_team=True,
             # agent message not relevant here
@@ -29,12 +39,7 @@ class NotteAPIError(NotteBaseError):
 
 class NotteAPIExecutionError(NotteBaseError):
     def __init__(self, path: str, response: Response) -> None:
-        try:
-            error = response.json()
-        except Exception:
-            if hasattr(response, "text"):
-                error = response.text
-            raise ValueError(response)
+        error = _error_body(response)
 
         message = f"Error on {path}: {error}"
         super().__init__(
@@ -73,15 +78,19 @@ def retry(
     delay_seconds: float = 5.0,
     error_message: str = "An error occurred while executing the function. Try again later...",
     exceptions: tuple[type[Exception], ...] = (Exception,),
+    max_delay_seconds: float = 30.0,
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """
     A decorator that retries a function if it raises specified exceptions.
 
+    Waits between attempts follow an exponential backoff with full jitter, i.e. a random delay in
+    `[0, min(max_delay_seconds, delay_seconds * 2**attempt)]`, so that concurrent clients do not retry in lockstep.
+
     Args:
         max_tries: Maximum number of attempts to retry the function
-        delay_seconds: Time to wait between retries in seconds
+        delay_seconds: Base time to wait between retries in seconds
         exceptions: Tuple of exception types to catch and retry
-        logger: Optional logger instance to use for logging retries
+        max_delay_seconds: Upper bound of the time to wait between retries in seconds
 
     Returns:
         The decorated function that implements the retry logic
@@ -101,7 +110,7 @@ def retry(
                         logger.warning(
                             (f"Failed to execute {func.__name__}: {str(e)} (attempt {attempt + 1}/{max_tries})")
                         )
-                        time.sleep(delay_seconds)
+                        time.sleep(random.uniform(0, min(max_delay_seconds, delay_seconds * 2**attempt)))
                     continue
 
             if last_exception is not None:
@@ -1,7 +1,8 @@
 import asyncio
+import concurrent.futures
 import threading
 from collections.abc import AsyncIterator
-from typing import Any
+from typing import Any, ClassVar
 
 import websockets.client
 from loguru import logger
@@ -9,65 +10,82 @@ from notte_core.common.resource import SyncResource
 from pydantic import BaseModel, PrivateAttr
 from typing_extensions import override
 
+try:
+    # optional (`notte-sdk[uvloop]`): much cheaper per-frame overhead for the recording stream
+    import uvloop  # pyright: ignore[reportMissingImports]
+
+    _new_event_loop = uvloop.new_event_loop  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+except ImportError:
+    _new_event_loop = asyncio.new_event_loop
+
+_shared_loop: asyncio.AbstractEventLoop | None = None
+_shared_loop_lock = threading.Lock()
+
+# shared by every display: rendering into the notebook is serial anyway, and a single worker keeps frames in order
+# and caps the thread count regardless of how many viewers are open (threads are only spawned on first use)
+_display_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="notte-display")
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the process-wide background event loop, starting it on first use.
+
+    All displays share this loop (and its single daemon thread) instead of spawning one thread per viewer.
+    """
+    global _shared_loop
+    with _shared_loop_lock:
+        if _shared_loop is None:
+            loop: asyncio.AbstractEventLoop = _new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="notte-jupyter-display", daemon=True)
+            thread.start()
+            _shared_loop = loop
+        return _shared_loop
+
 
 class WebsocketJupyterDisplay(BaseModel, SyncResource):  # pyright: ignore [reportUnsafeMultipleInheritance]
     """WebSocket client for receiving session recording data in binary format."""
 
     wss_url: str
-    _thread: threading.Thread | None = PrivateAttr(default=None)
+    MAX_RECONNECT_ATTEMPTS: ClassVar[int] = 5
+    RECONNECT_BASE_DELAY_SECONDS: ClassVar[float] = 0.5
+    RECONNECT_MAX_DELAY_SECONDS: ClassVar[float] = 8.0
     _stop_event: threading.Event | None = PrivateAttr(default=None)
-    _loop: asyncio.AbstractEventLoop | None = PrivateAttr(default=None)
-    _ws_task: asyncio.Task | None = PrivateAttr(default=None)  # pyright: ignore [reportMissingTypeArgument]
-
-    def _run_async_loop(self) -> None:
-        """Run the async event loop in a separate thread."""
-        self._loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self._loop)
-        try:
-            # Create a task that we can cancel
-            self._ws_task = self._loop.create_task(self.watch())
-            self._loop.run_until_complete(self._ws_task)  # pyright: ignore [reportUnknownMemberType, reportUnknownArgumentType]
-        except asyncio.CancelledError:
-            pass  # Task was cancelled, which is expected during shutdown
-        except Exception as e:
-            logger.debug(f"Unexpected exception in recording loop: {e}")
-        finally:
-            # Run all remaining tasks to completion
-            pending = asyncio.all_tasks(self._loop)
-            for task in pending:
-                _ = task.cancel()
-            if pending:
-                # Allow tasks to perform cleanup
-                _ = self._loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
-            self._loop.close()
-            self._loop = None
-            self._ws_task = None
+    _ws_future: concurrent.futures.Future[None] | None = PrivateAttr(default=None)
+    _websocket: websockets.client.WebSocketClientProtocol | None = PrivateAttr(default=None)
 
     @override
     def start(self) -> None:
-        """Start recording in a separate thread."""
+        """Start recording on the shared background event loop."""
         self._stop_event = threading.Event()
-        self._thread = threading.Thread(target=self._run_async_loop)
-        self._thread.daemon = True  # Make it a daemon thread
-        self._thread.start()
+        self._ws_future = asyncio.run_coroutine_threadsafe(self.watch(), _get_loop())
+        self._ws_future.add_done_callback(WebsocketJupyterDisplay._log_watch_failure)
+
+    @staticmethod
+    def _log_watch_failure(future: concurrent.futures.Future[None]) -> None:
+        # nothing else waits on the shared loop's future: report errors here or they are lost
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            logger.debug(f"Unexpected exception in recording loop: {error!r}")
 
     @override
     def stop(self) -> None:
-        """Stop the recording thread."""
+        """Stop the recording task."""
         if self._stop_event:
             self._stop_event.set()
 
-        if self._loop and self._ws_task and self._thread and self._thread.is_alive():  # pyright: ignore [reportUnknownMemberType]
-            # Schedule task cancellation from the main thread
-            _ = asyncio.run_coroutine_threadsafe(self._cancel_tasks(), self._loop)
+        if self._websocket is not None and _shared_loop is not None:
+            # a clean close ends `connect()`'s receive loop on its own, without cancelling the task
+            try:
+                asyncio.run_coroutine_threadsafe(self._websocket.close(code=1000), _shared_loop).result(timeout=1.0)
+            except Exception as e:
+                logger.debug(f"[Session Viewer] Failed to close WebSocket: {e}")
 
-        if self._thread:
-            # Give it a reasonable timeout
-            self._thread.join(timeout=5.0)
-            if self._thread.is_alive():
-                logger.debug("WebSocket thread did not terminate gracefully")
-            self._thread = None
-            self._stop_event = None
+        if self._ws_future:
+            # no-op if the task already completed, otherwise cancels it on the shared loop
+            _ = self._ws_future.cancel()
+            self._ws_future = None
+        self._stop_event = None
 
     @staticmethod
     def display_image(image_data: bytes) -> Any:
@@ -84,48 +102,104 @@ class WebsocketJupyterDisplay(BaseModel, SyncResource):  # pyright: ignore [repo
         except ImportError as e:
             raise RuntimeError("This method requires IPython/Jupyter environment") from e
 
-    async def _cancel_tasks(self) -> None:
-        """Cancel all tasks in the event loop."""
-        if self._ws_task:  # pyright: ignore [reportUnknownMemberType]
-            _ = self._ws_task.cancel()  # pyright: ignore [reportUnknownMemberType]
-            try:
-                await self._ws_task  # pyright: ignore [reportUnknownMemberType]
-            except asyncio.CancelledError:
-                pass
-
     async def connect(self) -> AsyncIterator[bytes]:
         """Connect to the WebSocket and yield binary recording data.
+
+        Dropped connections (and failed attempts to re-open them) are retried up to `MAX_RECONNECT_ATTEMPTS` times,
+        with exponential backoff.
+        A clean close (end of the recording or `stop()`) ends the stream, and so does a rejected handshake
+        (e.g. the session expired or was stopped).
+
         Yields:
             Binary data chunks from the recording stream
         """
-        websocket = None
+        # bind locally: stop() resets the attribute from another thread
+        stop_event = self._stop_event
+        attempt = 0
         try:
-            websocket = await websockets.client.connect(self.wss_url)
-            async for message in websocket:
-                if isinstance(message, bytes):
-                    yield message
-                else:
-                    logger.debug(f"[Session Viewer] Received non-binary message: {message}")
-        except websockets.exceptions.WebSocketException as e:
-            logger.debug(f"[Session Viewer] WebSocket error: {e}")
-            raise
+            while True:
+                try:
+                    # frames are already-compressed images: permessage-deflate would only burn CPU on both ends
+                    async with websockets.client.connect(self.wss_url, compression=None) as websocket:
+                        self._websocket = websocket
+                        async for message in websocket:
+                            # the connection is healthy again: later drops get a fresh retry budget
+                            attempt = 0
+                            if isinstance(message, bytes):
+                                yield message
+                            else:
+                                logger.debug(f"[Session Viewer] Received non-binary message: {message}")
+                    return
+                except (websockets.exceptions.ConnectionClosedError, OSError, asyncio.TimeoutError) as e:
+                    # a dropped connection, or a (re)connect that failed before the handshake (refused, dns, timeout)
+                    if stop_event is not None and stop_event.is_set():
+                        return
+                    attempt += 1
+                    if attempt > self.MAX_RECONNECT_ATTEMPTS:
+                        logger.warning(
+                            f"[Session Viewer] WebSocket connection lost, giving up after {attempt - 1} retries: {e!r}"
+                        )
+                        return
+                    delay = min(
+                        self.RECONNECT_MAX_DELAY_SECONDS, self.RECONNECT_BASE_DELAY_SECONDS * 2 ** (attempt - 1)
+                    )
+                    logger.debug(f"[Session Viewer] WebSocket connection lost, reconnecting in {delay:.1f}s: {e!r}")
+                    await asyncio.sleep(delay)
+                except websockets.exceptions.InvalidHandshake as e:
+                    # includes `InvalidStatusCode`: the server refused the viewer, retrying won't help
+                    logger.warning(f"[Session Viewer] WebSocket connection rejected: {e}")
+                    return
+                finally:
+                    self._websocket = None
         except asyncio.CancelledError:
             # Handle cancellation explicitly
             logger.trace("[Session Viewer] WebSocket connection cancelled")
             raise
-        finally:
-            # Clean up WebSocket connection
-            if websocket and not websocket.closed:
-                await websocket.close()
 
     async def watch(self) -> None:
         """Display the recording stream as live images in Jupyter notebook."""
 
+        loop = asyncio.get_running_loop()
+        # bind locally: stop() resets the attribute from another thread
+        stop_event = self._stop_event
+        # single-slot buffer: frames arriving while one is being rendered overwrite each other, so a live viewer
+        # skips what it can't keep up with but always ends up showing the most recent frame
+        latest: bytes | None = None
+        frame_ready = asyncio.Event()
+        stream_ended = False
+
+        async def render_latest() -> None:
+            nonlocal latest
+            while True:
+                if latest is None:
+                    if stream_ended:
+                        return
+                    _ = await frame_ready.wait()
+                    frame_ready.clear()
+                    continue
+                frame, latest = latest, None
+                await loop.run_in_executor(_display_executor, WebsocketJupyterDisplay.display_image, frame)
+
+        renderer = loop.create_task(render_latest())
         try:
             async for chunk in self.connect():
-                if self._stop_event and self._stop_event.is_set():
+                if stop_event and stop_event.is_set():
+                    break
+                if renderer.done():
+                    # the renderer only stops early on error (e.g. missing IPython): no point in reading more frames
                     break
-                _ = WebsocketJupyterDisplay.display_image(chunk)
+                latest = chunk
+                frame_ready.set()
+            # flush the pending frame (usually the final state of the page) before returning
+            stream_ended = True
+            frame_ready.set()
+            try:
+                await renderer
+            except Exception as e:
+                # warn explicitly: the viewer otherwise just stays blank in the notebook
+                logger.warning(f"[Session Viewer] Failed to display the recording: {e!r}")
 
         except asyncio.CancelledError:
             logger.trace("[Session Viewer] Task cancelled")
+        finally:
+            _ = renderer.cancel()
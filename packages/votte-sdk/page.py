@@ -1,8 +1,10 @@
 from collections.abc import Sequence
+from functools import cache, lru_cache
 from typing import TypeVar, Unpack
 
+import requests
 from notte_core.data.space import DataSpace
-from pydantic import BaseModel
+from pydantic import BaseModel, RootModel
 from typing_extensions import final, override
 
 from notte_sdk.endpoints.base import BaseClient, NotteEndpoint
@@ -20,6 +22,11 @@ from notte_sdk.types import (
 
 TSessionRequestDict = TypeVar("TSessionRequestDict", bound=SessionRequest)
 
+# bind the pydantic-core validators once: skips `model_validate`'s per-call dispatch on the hot path
+_validate_scrape_request = ScrapeRequest.__pydantic_validator__.validate_python
+_validate_observe_request = ObserveRequest.__pydantic_validator__.validate_python
+_validate_step_request = StepRequest.__pydantic_validator__.validate_python
+
 
 @final
 class PageClient(BaseClient):
@@ -39,6 +46,7 @@ class PageClient(BaseClient):
         self,
         api_key: str | None = None,
         verbose: bool = False,
+        http: requests.Session | None = None,
     ):
         """
         Initialize the PageClient instance.
@@ -49,9 +57,11 @@ class PageClient(BaseClient):
             api_key: Optional API key used for authenticating API requests.
         """
         # TODO: change to page base endpoint when it's deployed
-        super().__init__(base_endpoint_path="sessions", api_key=api_key, verbose=verbose)
+        super().__init__(base_endpoint_path="sessions", api_key=api_key, verbose=verbose, http=http)
 
+    # endpoints are immutable: memoize them per session id so that hot loops (e.g. `repeat`) don't rebuild them
     @staticmethod
+    @lru_cache(maxsize=256)
     def page_scrape_endpoint(session_id: str | None = None) -> NotteEndpoint[ScrapeResponse]:
         """
         Creates a NotteEndpoint for the scrape action.
@@ -66,6 +76,7 @@ class PageClient(BaseClient):
         return NotteEndpoint(path=path, response=ScrapeResponse, method="POST")
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def page_observe_endpoint(session_id: str | None = None) -> NotteEndpoint[ObserveResponse]:
         """
         Creates a NotteEndpoint for observe operations.
@@ -80,6 +91,7 @@ class PageClient(BaseClient):
         return NotteEndpoint(path=path, response=ObserveResponse, method="POST")
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def page_step_endpoint(session_id: str | None = None) -> NotteEndpoint[ObserveResponse]:
         """
         Creates a NotteEndpoint for initiating a step action.
@@ -93,6 +105,7 @@ class PageClient(BaseClient):
 
     @override
     @staticmethod
+    @cache
     def endpoints() -> Sequence[NotteEndpoint[BaseModel]]:
         """
         Returns the API endpoints for scraping, observing, and stepping actions.
@@ -100,11 +113,11 @@ class PageClient(BaseClient):
         This function aggregates and returns the endpoints used by the client to perform
         scrape, observe, and step operations with the Notte API.
         """
-        return [
+        return (
             PageClient.page_scrape_endpoint(),
             PageClient.page_observe_endpoint(),
             PageClient.page_step_endpoint(),
-        ]
+        )
 
     def scrape(self, session_id: str, **data: Unpack[ScrapeRequestDict]) -> DataSpace:
         """
@@ -124,7 +137,7 @@ class PageClient(BaseClient):
         Raises:
             InvalidRequestError: If neither 'url' nor 'session_id' is supplied.
         """
-        request = ScrapeRequest.model_validate(data)
+        request: ScrapeRequest = _validate_scrape_request(data)
         endpoint = PageClient.page_scrape_endpoint(session_id=session_id)
         response = self.request(endpoint.with_request(request))
         # Manually override the data.structured space to better match the response format
@@ -132,7 +145,10 @@ class PageClient(BaseClient):
         structured = response.data.structured
         if response_format is not None and structured is not None:
             if structured.success and structured.data is not None:
-                structured.data = response_format.model_validate(structured.data.model_dump())
+                # validate the payload in place rather than dumping it to a fresh dict first
+                data = structured.data
+                raw = data.root if isinstance(data, RootModel) else data  # pyright: ignore[reportUnknownMemberType]
+                structured.data = response_format.model_validate(raw, from_attributes=True)
         return response.data
 
     def observe(self, session_id: str, **data: Unpack[ObserveRequestDict]) -> ObserveResponse:
@@ -150,7 +166,7 @@ class PageClient(BaseClient):
         Returns:
             Observation: The formatted observation result from the API response.
         """
-        request = ObserveRequest.model_validate(data)
+        request: ObserveRequest = _validate_observe_request(data)
         endpoint = PageClient.page_observe_endpoint(session_id=session_id)
         obs_response = self.request(endpoint.with_request(request))
         return obs_response
@@ -170,7 +186,20 @@ class PageClient(BaseClient):
         Returns:
             An Observation object constructed from the API response.
         """
-        request = StepRequest.model_validate(data)
+        request: StepRequest = _validate_step_request(data)
+        return self.step_with_request(session_id, request)
+
+    def step_with_request(self, session_id: str, request: StepRequest) -> ObserveResponse:
+        """
+        Sends an already validated step action request and returns an Observation.
+
+        Args:
+            session_id: The session in which to execute the step.
+            request: The step request to send.
+
+        Returns:
+            An Observation object constructed from the API response.
+        """
         endpoint = PageClient.page_step_endpoint(session_id=session_id)
         obs_response = self.request(endpoint.with_request(request))
         return obs_response
@@ -1,6 +1,8 @@
 from collections.abc import Sequence
+from functools import cache, lru_cache
 from typing import Unpack
 
+import requests
 from pydantic import BaseModel
 from typing_extensions import final, override
 
@@ -20,6 +22,12 @@ from notte_sdk.types import (
     VirtualNumberResponse,
 )
 
+# bind the pydantic-core validators once: skips `model_validate`'s per-call dispatch
+_validate_persona_create_request = PersonaCreateRequest.__pydantic_validator__.validate_python
+_validate_virtual_number_request = VirtualNumberRequest.__pydantic_validator__.validate_python
+_validate_emails_read_request = EmailsReadRequest.__pydantic_validator__.validate_python
+_validate_sms_read_request = SMSReadRequest.__pydantic_validator__.validate_python
+
 
 @final
 class PersonasClient(BaseClient):
@@ -43,28 +51,32 @@ class PersonasClient(BaseClient):
         self,
         api_key: str | None = None,
         verbose: bool = False,
+        http: requests.Session | None = None,
     ):
         """
         Initialize a PersonasClient instance.
 
         Initializes the client with an optional API key for persona management.
         """
-        super().__init__(base_endpoint_path="personas", api_key=api_key, verbose=verbose)
+        super().__init__(base_endpoint_path="personas", api_key=api_key, verbose=verbose, http=http)
 
     @override
     @staticmethod
+    @cache
     def endpoints() -> Sequence[NotteEndpoint[BaseModel]]:
         """Returns the available persona endpoints.
 
         Aggregates endpoints from PersonasClient for creating personas, reading messages, etc..."""
-        return [
+        return (
             PersonasClient.email_read_endpoint(""),
             PersonasClient.sms_read_endpoint(""),
             PersonasClient.create_number_endpoint(""),
             PersonasClient.create_persona_endpoint(),
-        ]
+        )
 
+    # endpoints are immutable: memoize them per persona id
     @staticmethod
+    @lru_cache(maxsize=256)
     def email_read_endpoint(persona_id: str) -> NotteEndpoint[EmailResponse]:
         """
         Returns a NotteEndpoint configured for reading persona emails.
@@ -79,6 +91,7 @@ class PersonasClient(BaseClient):
         )
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def sms_read_endpoint(persona_id: str) -> NotteEndpoint[SMSResponse]:
         """
         Returns a NotteEndpoint configured for reading persona sms messages.
@@ -93,6 +106,7 @@ class PersonasClient(BaseClient):
         )
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def create_number_endpoint(persona_id: str) -> NotteEndpoint[VirtualNumberResponse]:
         """
         Returns a NotteEndpoint configured for creating a virtual phone number.
@@ -127,7 +141,7 @@ class PersonasClient(BaseClient):
         Returns:
             PersonaCreateResponse: The persona created
         """
-        params = PersonaCreateRequest.model_validate(data)
+        params: PersonaCreateRequest = _validate_persona_create_request(data)
         response = self.request(PersonasClient.create_persona_endpoint().with_request(params))
         return response
 
@@ -140,7 +154,7 @@ class PersonasClient(BaseClient):
         Returns:
             VirtualNumberResponse: The status
         """
-        params = VirtualNumberRequest.model_validate(data)
+        params: VirtualNumberRequest = _validate_virtual_number_request(data)
         response = self.request(PersonasClient.create_number_endpoint(persona_id).with_request(params))
         return response
 
@@ -148,13 +162,16 @@ class PersonasClient(BaseClient):
         """
         Reads recent emails sent to the persona
 
+        This is a single GET: the server returns at most `limit` emails (optionally restricted to the
+        `timedelta` window) in one response. To fetch more, raise `limit` rather than issuing repeated calls.
+
         Args:
             **data: Keyword arguments representing details for querying emails.
 
         Returns:
             Sequence[EmailResponse]: The list of emails found
         """
-        request = EmailsReadRequest.model_validate(data)
+        request: EmailsReadRequest = _validate_emails_read_request(data)
         response = self.request_list(PersonasClient.email_read_endpoint(persona_id).with_params(request))
         return response
 
@@ -162,12 +179,15 @@ class PersonasClient(BaseClient):
         """
         Reads recent sms messages sent to the persona
 
+        This is a single GET: the server returns at most `limit` sms messages (optionally restricted to the
+        `timedelta` window) in one response. To fetch more, raise `limit` rather than issuing repeated calls.
+
         Args:
             **data: Keyword arguments representing details for querying sms messages.
 
         Returns:
             Sequence[SMSResponse]: The list of sms messages found
         """
-        request = SMSReadRequest.model_validate(data)
+        request: SMSReadRequest = _validate_sms_read_request(data)
         response = self.request_list(PersonasClient.sms_read_endpoint(persona_id).with_params(request))
         return response
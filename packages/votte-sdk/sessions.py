@@ -1,9 +1,15 @@
+import asyncio
+import builtins
+import os
+import time
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import List, Unpack  # pyright: ignore [reportDeprecated]
-from urllib.parse import urljoin
-from webbrowser import open as open_browser
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar, Unpack
 
+import requests
 from loguru import logger
 from notte_core.browser.observation import Observation
 from notte_core.common.resource import SyncResource
@@ -31,7 +37,34 @@ from notte_sdk.types import (
     TabSessionDebugRequest,
     TabSessionDebugResponse,
 )
-from notte_sdk.websockets.jupyter import WebsocketJupyterDisplay
+
+if TYPE_CHECKING:
+    # only needed by the notebook viewer: imported on first use (pulls in websockets)
+    from notte_sdk.websockets.jupyter import WebsocketJupyterDisplay
+
+
+MAX_CONCURRENT_SESSION_STARTS = 16
+
+
+@cache
+def _sessions_executor() -> ThreadPoolExecutor:
+    # shared by all factories so that concurrent session starts are bounded process-wide
+    return ThreadPoolExecutor(max_workers=MAX_CONCURRENT_SESSION_STARTS, thread_name_prefix="notte-sessions")
+
+
+@lru_cache(maxsize=32)
+def _load_cookie_fields(path: str, mtime_ns: int) -> tuple[MappingProxyType[str, Any], ...]:
+    """Parse a cookie file once per version: `mtime_ns` is only part of the key, so that edits invalidate the cache.
+
+    Only read-only mappings of the (json primitive) cookie fields are cached: callers build fresh models from them.
+    """
+    return tuple(MappingProxyType(dict(cookie.__dict__)) for cookie in Cookie.from_json(path))
+
+
+def _load_cookies_request(path: str, mtime_ns: int) -> SetCookiesRequest:
+    # a new request (and cookies) per call: mutating one never leaks into later `set_cookies` calls
+    cookies = [Cookie.model_construct(**fields) for fields in _load_cookie_fields(path, mtime_ns)]
+    return SetCookiesRequest.model_construct(cookies=cookies)
 
 
 @final
@@ -62,6 +95,7 @@ class SessionsClient(BaseClient):
         self,
         api_key: str | None = None,
         verbose: bool = False,
+        http: requests.Session | None = None,
     ):
         """
         Initialize a SessionsClient instance.
@@ -69,10 +103,12 @@ class SessionsClient(BaseClient):
         Initializes the client with an optional API key and server URL for session management,
         setting the base endpoint to "sessions". Also initializes the last session response to None.
         """
-        super().__init__(base_endpoint_path="sessions", api_key=api_key, verbose=verbose)
-        self.page: PageClient = PageClient(api_key=api_key, verbose=verbose)
+        super().__init__(base_endpoint_path="sessions", api_key=api_key, verbose=verbose, http=http)
+        self.page: PageClient = PageClient(api_key=api_key, verbose=verbose, http=self._http)
 
+    # endpoints are immutable: memoize them (per session id)
     @staticmethod
+    @cache
     def session_start_endpoint() -> NotteEndpoint[SessionResponse]:
         """
         Returns a NotteEndpoint configured for starting a session.
@@ -82,6 +118,7 @@ class SessionsClient(BaseClient):
         return NotteEndpoint(path=SessionsClient.SESSION_START, response=SessionResponse, method="POST")
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def session_stop_endpoint(session_id: str | None = None) -> NotteEndpoint[SessionResponse]:
         """
         Constructs a DELETE endpoint for closing a session.
@@ -101,6 +138,7 @@ class SessionsClient(BaseClient):
         return NotteEndpoint(path=path, response=SessionResponse, method="DELETE")
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def session_status_endpoint(session_id: str | None = None) -> NotteEndpoint[SessionResponse]:
         """
         Returns a NotteEndpoint for retrieving the status of a session.
@@ -133,6 +171,7 @@ class SessionsClient(BaseClient):
         )
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def session_debug_endpoint(session_id: str | None = None) -> NotteEndpoint[SessionDebugResponse]:
         """
         Creates a NotteEndpoint for retrieving session debug information.
@@ -169,6 +208,7 @@ class SessionsClient(BaseClient):
         )
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def session_debug_replay_endpoint(session_id: str | None = None) -> NotteEndpoint[BaseModel]:
         """
         Returns an endpoint for retrieving the replay for a session.
@@ -179,6 +219,7 @@ class SessionsClient(BaseClient):
         return NotteEndpoint(path=path, response=BaseModel, method="GET")
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def session_set_cookies_endpoint(session_id: str | None = None) -> NotteEndpoint[SetCookiesResponse]:
         """
         Returns a NotteEndpoint for uploading cookies to a session.
@@ -189,6 +230,7 @@ class SessionsClient(BaseClient):
         return NotteEndpoint(path=path, response=SetCookiesResponse, method="POST")
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def session_get_cookies_endpoint(session_id: str | None = None) -> NotteEndpoint[GetCookiesResponse]:
         """
         Returns a NotteEndpoint for retrieving cookies from a session.
@@ -200,12 +242,13 @@ class SessionsClient(BaseClient):
 
     @override
     @staticmethod
+    @cache
     def endpoints() -> Sequence[NotteEndpoint[BaseModel]]:
         """Returns a sequence of available session endpoints.
 
         Aggregates endpoints from SessionsClient for starting, closing, status checking, listing,
         and debugging sessions (including tab-specific debugging)."""
-        return [
+        return (
             SessionsClient.session_start_endpoint(),
             SessionsClient.session_stop_endpoint(),
             SessionsClient.session_status_endpoint(),
@@ -215,7 +258,7 @@ class SessionsClient(BaseClient):
             SessionsClient.session_debug_replay_endpoint(),
             SessionsClient.session_set_cookies_endpoint(),
             SessionsClient.session_get_cookies_endpoint(),
-        ]
+        )
 
     def start(self, **data: Unpack[SessionStartRequestDict]) -> SessionResponse:
         """
@@ -231,8 +274,28 @@ class SessionsClient(BaseClient):
             SessionResponse: The response received from the session start endpoint.
         """
         request = SessionStartRequest.model_validate(data)
-        response = self.request(SessionsClient.session_start_endpoint().with_request(request))
-        return response
+        return self.start_with_request(request)
+
+    def start_with_request(self, request: SessionStartRequest) -> SessionResponse:
+        """
+        Starts a new session from an already validated request.
+
+        Args:
+            request: The session start request.
+
+        Returns:
+            SessionResponse: The response received from the session start endpoint.
+        """
+        return self.request(SessionsClient.session_start_endpoint().with_request(request))
+
+    async def astart(self, **data: Unpack[SessionStartRequestDict]) -> SessionResponse:
+        """
+        Asynchronously starts a new session.
+
+        The request runs in a worker thread over the client's pooled connection, so that independent
+        calls can be awaited together (e.g. with `asyncio.gather`) without blocking the event loop.
+        """
+        return await asyncio.to_thread(self.start, **data)
 
     def stop(self, session_id: str) -> SessionResponse:
         """
@@ -254,6 +317,12 @@ class SessionsClient(BaseClient):
         response = self.request(endpoint)
         return response
 
+    async def astop(self, session_id: str) -> SessionResponse:
+        """
+        Asynchronously stops an active session (see `astart`).
+        """
+        return await asyncio.to_thread(self.stop, session_id)
+
     def status(self, session_id: str) -> SessionResponse:
         """
         Retrieves the current status of a session.
@@ -266,6 +335,12 @@ class SessionsClient(BaseClient):
         response = self.request(endpoint)
         return response
 
+    async def astatus(self, session_id: str) -> SessionResponse:
+        """
+        Asynchronously retrieves the current status of a session (see `astart`).
+        """
+        return await asyncio.to_thread(self.status, session_id)
+
     def list(self, **data: Unpack[SessionListRequestDict]) -> Sequence[SessionResponse]:
         """
         Retrieves a list of sessions from the API.
@@ -274,6 +349,14 @@ class SessionsClient(BaseClient):
         sessions. Returns a sequence of session response objects.
         """
         params = SessionListRequest.model_validate(data)
+        return self.list_with_request(params)
+
+    def list_with_request(self, params: SessionListRequest) -> Sequence[SessionResponse]:
+        """
+        Retrieves a list of sessions from already validated listing criteria.
+
+        Lets callers that poll the session list build the request once and reuse it.
+        """
         endpoint = SessionsClient.session_list_endpoint(params=params)
         return self.request_list(endpoint)
 
@@ -325,27 +408,47 @@ class SessionsClient(BaseClient):
         file_bytes = self._request_file(endpoint, file_type="webp")
         return WebpReplay(file_bytes)
 
-    def display_in_browser(self, session_id: str) -> None:
+    async def areplay(self, session_id: str) -> WebpReplay:
+        """
+        Asynchronously downloads the replay for the specified session (see `astart`).
+        """
+        return await asyncio.to_thread(self.replay, session_id)
+
+    def display_in_browser(self, session_id: str, debug_info: SessionDebugResponse | None = None) -> None:
         """
         Opens live session replay in browser (frame by frame)
+
+        `debug_info` can be passed to reuse already fetched debug information.
         """
-        debug_info = self.debug_info(session_id=session_id)
+        if debug_info is None:
+            debug_info = self.debug_info(session_id=session_id)
+
+        viewer_url = (
+            f"{self.server_url.rstrip('/')}/{self.base_endpoint_path}/{self.SESSION_VIEWER}/"
+            f"index.html?ws={debug_info.ws.recording}"
+        )
+        from webbrowser import open as open_browser
 
-        base_url = urljoin(self.server_url + "/", f"{self.base_endpoint_path}/{self.SESSION_VIEWER}/")
-        viewer_url = urljoin(base_url, f"index.html?ws={debug_info.ws.recording}")
         _ = open_browser(viewer_url, new=1)
 
-    def display_in_notebook(self, session_id: str) -> WebsocketJupyterDisplay:
+    def display_in_notebook(
+        self, session_id: str, debug_info: SessionDebugResponse | None = None
+    ) -> "WebsocketJupyterDisplay":
         """
         Returns a WebsocketJupyterDisplay for displaying live session replay in Jupyter notebook.
+
+        `debug_info` can be passed to reuse already fetched debug information.
         """
-        debug_info = self.debug_info(session_id=session_id)
+        if debug_info is None:
+            debug_info = self.debug_info(session_id=session_id)
+        from notte_sdk.websockets.jupyter import WebsocketJupyterDisplay
+
         return WebsocketJupyterDisplay(wss_url=debug_info.ws.recording)
 
     def set_cookies(
         self,
         session_id: str,
-        cookies: List[Cookie] | None = None,  # pyright: ignore [reportDeprecated]
+        cookies: builtins.list[Cookie] | None = None,  # `list` is shadowed by the `list` method here
         cookie_file: str | Path | None = None,
     ) -> SetCookiesResponse:
         """
@@ -368,7 +471,12 @@ class SessionsClient(BaseClient):
         if cookies is not None:
             request = SetCookiesRequest(cookies=cookies)
         elif cookie_file is not None:
-            request = SetCookiesRequest.from_json(cookie_file)
+            try:
+                mtime_ns = os.stat(cookie_file).st_mtime_ns
+            except FileNotFoundError as e:
+                # same error as `Cookie.from_json`, which the cache key lookup now runs ahead of
+                raise FileNotFoundError(f"Cookies file not found at {Path(cookie_file)}") from e
+            request = _load_cookies_request(str(cookie_file), mtime_ns)
         else:
             raise ValueError("Have to provide either cookies or cookie_file")
 
@@ -384,7 +492,7 @@ class SessionsClient(BaseClient):
         endpoint = SessionsClient.session_get_cookies_endpoint(session_id=session_id)
         return self.request(endpoint)
 
-    def viewer(self, session_id: str) -> None:
+    def viewer(self, session_id: str, debug_info: SessionDebugResponse | None = None) -> None:
         """
         Opens a browser tab with the debug URL for visualizing the session.
 
@@ -394,12 +502,16 @@ class SessionsClient(BaseClient):
         Args:
             session_id (str, optional): The session identifier to use.
                 If not provided, the current session ID is used.
+            debug_info (SessionDebugResponse, optional): Already fetched debug information to reuse.
 
         Returns:
             None
         """
-        debug_info = self.debug_info(session_id=session_id)
+        if debug_info is None:
+            debug_info = self.debug_info(session_id=session_id)
         # open browser tab with debug_url
+        from webbrowser import open as open_browser
+
         _ = open_browser(debug_info.debug_url)
 
 
@@ -417,6 +529,18 @@ class RemoteSession(SyncResource):
         response (SessionResponse | None): The latest response from the session execution.
     """
 
+    __slots__ = (
+        "_debug_info",
+        "_debug_info_fetched_at",
+        "_open_viewer",
+        "_session_id",
+        "client",
+        "request",
+        "response",
+    )
+
+    DEBUG_INFO_TTL_SECONDS: ClassVar[float] = 30.0
+
     def __init__(self, client: SessionsClient, request: SessionStartRequest) -> None:
         """
         Initialize a new RemoteSession instance.
@@ -431,6 +555,10 @@ class RemoteSession(SyncResource):
         self.request.headless = True
         self.client: SessionsClient = client
         self.response: SessionResponse | None = None
+        self._session_id: str | None = None
+        # debug info (viewer/cdp urls) is stable for the session lifetime: share one round-trip between accessors
+        self._debug_info: SessionDebugResponse | None = None
+        self._debug_info_fetched_at: float = 0.0
 
     # #######################################################################
     # ############################# Session #################################
@@ -447,8 +575,17 @@ class RemoteSession(SyncResource):
         Raises:
             ValueError: If the session request is invalid.
         """
-        self.response = self.client.start(**self.request.model_dump())
-        logger.info(f"[Session] {self.session_id} started with request: {self.request.model_dump(exclude_none=True)}")
+        # the request was validated when the session was created: don't dump and re-validate it
+        self.response = self.client.start_with_request(self.request)
+        # read on every session/page call: keep it off the pydantic response
+        self._session_id = self.response.session_id
+        self._debug_info = None
+        # lazy: only dump the request if the record is actually emitted
+        logger.opt(lazy=True).info(
+            "[Session] {} started with request: {}",
+            lambda: self.session_id,
+            lambda: self.request.model_dump(exclude_none=True),
+        )
         if self._open_viewer:
             self.display_in_browser()
 
@@ -467,9 +604,18 @@ class RemoteSession(SyncResource):
         """
         logger.info(f"[Session] {self.session_id} stopped")
         self.response = self.client.stop(session_id=self.session_id)
+        self._debug_info = None
         if self.response.status != "closed":
             raise RuntimeError(f"[Session] {self.session_id} failed to stop")
 
+    def __del__(self) -> None:
+        # a session that is never stopped keeps running on the API until it times out
+        response = getattr(self, "response", None)
+        if response is not None and response.status == "active":
+            logger.warning(
+                f"[Session] {response.session_id} was not stopped: call `stop()` or use the session as a context manager"
+            )
+
     @property
     def session_id(self) -> str:
         """
@@ -481,9 +627,9 @@ class RemoteSession(SyncResource):
         Raises:
             ValueError: If the session hasn't been started yet (no response available).
         """
-        if self.response is None:
+        if self._session_id is None:
             raise ValueError("You need to start the session first to get the session id")
-        return self.response.session_id
+        return self._session_id
 
     def replay(self) -> WebpReplay:
         """
@@ -501,13 +647,13 @@ class RemoteSession(SyncResource):
         """
         Opens live session replay in browser (frame by frame)
         """
-        return self.client.display_in_browser(self.session_id)
+        return self.client.display_in_browser(self.session_id, debug_info=self.debug_info())
 
-    def display_in_notebook(self) -> WebsocketJupyterDisplay:
+    def display_in_notebook(self) -> "WebsocketJupyterDisplay":
         """
         Returns a WebsocketJupyterDisplay for displaying live session replay in Jupyter notebook.
         """
-        return self.client.display_in_notebook(session_id=self.session_id)
+        return self.client.display_in_notebook(session_id=self.session_id, debug_info=self.debug_info())
 
     def viewer(self) -> None:
         """
@@ -518,7 +664,7 @@ class RemoteSession(SyncResource):
         Raises:
             ValueError: If the session hasn't been started yet (no session_id available).
         """
-        self.client.viewer(session_id=self.session_id)
+        self.client.viewer(session_id=self.session_id, debug_info=self.debug_info())
 
     def status(self) -> SessionResponse:
         """
@@ -534,7 +680,7 @@ class RemoteSession(SyncResource):
 
     def set_cookies(
         self,
-        cookies: List[Cookie] | None = None,  # pyright: ignore [reportDeprecated]
+        cookies: list[Cookie] | None = None,
         cookie_file: str | Path | None = None,
     ) -> SetCookiesResponse:
         """
@@ -564,13 +710,31 @@ class RemoteSession(SyncResource):
         """
         Get detailed debug information for the session.
 
+        The response is cached for `DEBUG_INFO_TTL_SECONDS`: use `refresh_debug_info` to force a new request.
+
         Returns:
             SessionDebugResponse: Debug information for the session.
 
         Raises:
             ValueError: If the session hasn't been started yet (no session_id available).
         """
-        return self.client.debug_info(session_id=self.session_id)
+        if self._debug_info is None or time.monotonic() - self._debug_info_fetched_at > self.DEBUG_INFO_TTL_SECONDS:
+            return self.refresh_debug_info()
+        return self._debug_info
+
+    def refresh_debug_info(self) -> SessionDebugResponse:
+        """
+        Fetch the session's debug information from the API, bypassing (and updating) the cache.
+
+        Returns:
+            SessionDebugResponse: Debug information for the session.
+
+        Raises:
+            ValueError: If the session hasn't been started yet (no session_id available).
+        """
+        self._debug_info = self.client.debug_info(session_id=self.session_id)
+        self._debug_info_fetched_at = time.monotonic()
+        return self._debug_info
 
     def cdp_url(self) -> str:
         """
@@ -614,6 +778,8 @@ class RemoteSessionFactory:
         client (SessionsClient): The client used to communicate with the Notte API.
     """
 
+    __slots__ = ("client",)
+
     def __init__(self, client: SessionsClient) -> None:
         """
         Initialize a new RemoteSessionFactory instance.
@@ -638,3 +804,31 @@ class RemoteSessionFactory:
         """
         request = SessionStartRequest.model_validate(data)
         return RemoteSession(self.client, request)
+
+    def create_many(self, datas: Sequence[SessionStartRequestDict]) -> list[RemoteSession]:
+        """
+        Create and start several sessions concurrently.
+
+        Sessions are started from a shared thread pool, reusing the client's connection pool. If any
+        of them fails to start, the sessions that did start are stopped before the error is raised.
+
+        Args:
+            datas: The creation parameters of each session.
+
+        Returns:
+            list[RemoteSession]: The started sessions, in the same order as `datas`. Stopping them is up to the caller.
+        """
+        sessions = [self(**data) for data in datas]
+        futures = [_sessions_executor().submit(session.start) for session in sessions]
+        errors = [future.exception() for future in futures]
+        error = next((e for e in errors if e is not None), None)
+        if error is not None:
+            for session, session_error in zip(sessions, errors):
+                if session_error is None:
+                    # a failing stop must neither hide the start error nor skip the remaining sessions
+                    try:
+                        session.stop()
+                    except Exception as e:
+                        logger.warning(f"Failed to stop session {session.session_id} after a failed batch start: {e}")
+            raise error
+        return sessions
@@ -1,11 +1,12 @@
 import datetime as dt
-import json
 import os
-from base64 import b64decode, b64encode
+from base64 import b32decode
 from enum import StrEnum
+from functools import lru_cache
 from pathlib import Path
 from typing import Annotated, Any, Generic, Literal, Required, TypeVar
 
+import orjson
 from loguru import logger
 from notte_core.actions import (
     ActionParameter,
@@ -22,10 +23,19 @@ from notte_core.credentials.base import Credential, CredentialsDict, CreditCardD
 from notte_core.data.space import DataSpace
 from notte_core.utils.pydantic_schema import create_model_from_schema
 from notte_core.utils.url import get_root_domain
-from pydantic import BaseModel, Field, field_validator, model_validator
-from pyotp import TOTP
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator, model_validator
 from typing_extensions import TypedDict, override
 
+try:
+    # optional: SIMD base64 codec, several times faster on multi-megabyte replays
+    from pybase64 import b64decode, b64encode_as_string  # pyright: ignore[reportMissingImports]
+except ImportError:
+    from base64 import b64decode, b64encode
+
+    def b64encode_as_string(s: bytes) -> str:
+        return b64encode(s).decode("utf-8")
+
+
 # ############################################################
 # Session Management
 # ############################################################
@@ -101,6 +111,9 @@ class ProxySettings(BaseModel):
         )
 
 
+_SAME_SITE_VALUES = {"strict": "Strict", "lax": "Lax", "none": "None"}
+
+
 class Cookie(BaseModel):
     name: str
     domain: str
@@ -125,6 +138,14 @@ class Cookie(BaseModel):
             data["expires"] = float(data["expirationDate"])
         return data
 
+    @field_validator("sameSite", mode="before")
+    @classmethod
+    def normalize_same_site(cls, value: str | None) -> str | None:
+        if not isinstance(value, str):
+            return value
+        # canonical values map to shared strings: no per-cookie allocation
+        return _SAME_SITE_VALUES.get(value.lower()) or value.capitalize()
+
     @override
     def model_post_init(self, __context: Any) -> None:
         # Set expires if expirationDate is provided but expires is not
@@ -134,25 +155,31 @@ class Cookie(BaseModel):
         elif self.expires is not None and self.expirationDate is None:
             self.expirationDate = float(self.expires)
 
-        if self.sameSite is not None:
-            self.sameSite = self.sameSite.lower()
-            self.sameSite = self.sameSite[0].upper() + self.sameSite[1:]
-
     @staticmethod
-    def from_json(path: str | Path) -> list["Cookie"]:
+    def from_json(path: str | Path, validate: bool = True) -> list["Cookie"]:
+        """Load cookies from a json file.
+
+        Set `validate=False` only for trusted files (e.g. written by `dump_json`) to skip validation.
+        """
         path = Path(path)
-        if not path.exists():
-            raise FileNotFoundError(f"Cookies file not found at {path}")
-        with open(path, "r") as f:
-            cookies_json = json.load(f)
+        try:
+            # a single open: no separate `exists()` stat
+            raw = path.read_bytes()
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Cookies file not found at {path}") from e
+        cookies_json = orjson.loads(raw)
+        if not validate:
+            # `model_construct` still runs `model_post_init`, which mirrors expires/expirationDate
+            # (sameSite is already normalized in files written by `dump_json`)
+            return [Cookie.model_construct(**cookie) for cookie in cookies_json]
         cookies = [Cookie.model_validate(cookie) for cookie in cookies_json]
         return cookies
 
     @staticmethod
     def dump_json(cookies: list["Cookie"], path: str | Path) -> int:
         path = Path(path)
-        cookies_dump = [cookie.model_dump() for cookie in cookies]
-        return path.write_text(json.dumps(cookies_dump))
+        # cookie fields are all json primitives, stored as-is in `__dict__`: no need for pydantic's serializer
+        return path.write_bytes(orjson.dumps([cookie.__dict__ for cookie in cookies]))
 
 
 class SetCookiesRequest(BaseModel):
@@ -178,7 +205,7 @@ class ReplayResponse(BaseModel):
 
     model_config = {  # type: ignore[reportUnknownMemberType]
         "json_encoders": {
-            bytes: lambda v: b64encode(v).decode("utf-8") if v else None,
+            bytes: lambda v: b64encode_as_string(v) if v else None,
         }
     }
 
@@ -191,13 +218,14 @@ class ReplayResponse(BaseModel):
             return value
         if not isinstance(value, str):  # pyright: ignore[reportUnnecessaryIsInstance]
             raise ValueError("replay must be a bytes or a base64 encoded string")  # pyright: ignore[reportUnreachable]
-        return b64decode(value.encode("utf-8"))
+        # both codecs accept (ascii) str directly: no intermediate bytes copy
+        return b64decode(value)
 
     @override
     def model_dump(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
         data = super().model_dump(*args, **kwargs)
         if self.replay is not None:
-            data["replay"] = b64encode(self.replay).decode("utf-8")
+            data["replay"] = b64encode_as_string(self.replay)
         return data
 
 
@@ -261,41 +289,42 @@ class SessionStartRequest(BaseModel):
         return value
 
     def load_proxy_settings(self) -> ProxySettings | None:
-        if isinstance(self.proxies, bool) and not self.proxies:
+        if not isinstance(self.proxies, list) or len(self.proxies) == 0:
             return None
-
-        server = os.getenv("PROXY_URL")
-        username = os.getenv("PROXY_USERNAME")
-        password = os.getenv("PROXY_PASSWORD")
-        default_notte_proxy: ProxySettings | None = None
-        if server is not None and username is not None and password is not None:
-            logger.trace("[Notte Proxy] Using Notte proxy from environment variables")
-            default_notte_proxy = ProxySettings(
-                type=ProxyType.NOTTE,
-                server=server,
-                username=username,
-                password=password,
-                bypass=None,
+        if len(self.proxies) > 1:
+            logger.warning(
+                "[Notte Proxy] Only the first proxy from the list will be used. Multiple proxies are not supported yet."
             )
-        elif config.proxy_host is not None and config.proxy_username is not None and config.proxy_password is not None:
-            logger.trace("[Notte Proxy] Using Notte proxy from config")
-            default_notte_proxy = ProxySettings(
-                type=ProxyType.EXTERNAL,
-                server=config.proxy_host,
-                username=config.proxy_username,
-                password=config.proxy_password,
-                bypass=None,
-            )
-        if isinstance(self.proxies, list) and len(self.proxies) > 0:
-            if len(self.proxies) > 1:
-                logger.warning(
-                    "[Notte Proxy] Only the first proxy from the list will be used. Multiple proxies are not supported yet."
-                )
-            base_proxy: ProxySettings = self.proxies[0]
-            if base_proxy.type == ProxyType.NOTTE:
-                return default_notte_proxy
-            return base_proxy
-        return None
+        base_proxy: ProxySettings = self.proxies[0]
+        if base_proxy.type == ProxyType.NOTTE:
+            # only resolve the default proxy (environment / config lookups) when it is actually requested
+            return _default_notte_proxy()
+        return base_proxy
+
+
+def _default_notte_proxy() -> ProxySettings | None:
+    server = os.getenv("PROXY_URL")
+    username = os.getenv("PROXY_USERNAME")
+    password = os.getenv("PROXY_PASSWORD")
+    if server is not None and username is not None and password is not None:
+        logger.trace("[Notte Proxy] Using Notte proxy from environment variables")
+        return ProxySettings(
+            type=ProxyType.NOTTE,
+            server=server,
+            username=username,
+            password=password,
+            bypass=None,
+        )
+    if config.proxy_host is not None and config.proxy_username is not None and config.proxy_password is not None:
+        logger.trace("[Notte Proxy] Using Notte proxy from config")
+        return ProxySettings(
+            type=ProxyType.EXTERNAL,
+            server=config.proxy_host,
+            username=config.proxy_username,
+            password=config.proxy_password,
+            bypass=None,
+        )
+    return None
 
 
 class SessionRequest(BaseModel):
@@ -557,10 +586,14 @@ class AddCredentialsRequestDict(CredentialsDict, total=True):
     url: str
 
 
+# tldextract parsing is pure but costly: credential requests keep hitting the same few hosts
+_cached_root_domain = lru_cache(maxsize=4096)(get_root_domain)
+
+
 def validate_url(value: str | None) -> str | None:
     if value is None:
         return None
-    domain_url = get_root_domain(value)
+    domain_url = _cached_root_domain(value)
     if len(domain_url) == 0:
         raise ValueError(f"Invalid URL: {value}. Please provide a valid URL with a domain name.")
     return domain_url
@@ -590,7 +623,8 @@ class AddCredentialsRequest(BaseModel):
         secret = value.get("mfa_secret")
         if secret is not None:
             try:
-                _ = TOTP(secret).now()
+                # a secret is valid iff it decodes as base32 (same decoding as pyotp), no need to compute an OTP
+                _ = b32decode(secret + "=" * (-len(secret) % 8), casefold=True)
             except Exception:
                 raise ValueError("Invalid MFA secret code: did you try to store an OTP instead of a secret?")
 
@@ -769,6 +803,18 @@ class ScrapeRequestDict(ScrapeParamsDict, total=False):
     url: str | None
 
 
+@lru_cache(maxsize=256)
+def _cached_model_from_schema(schema_key: bytes) -> type[BaseModel]:
+    # building a model from a schema is expensive and scrape requests usually reuse the same schema
+    return create_model_from_schema(orjson.loads(schema_key))
+
+
+@lru_cache(maxsize=256)
+def _cached_json_schema(model: type[BaseModel]) -> bytes:
+    # a model's schema never changes: generate it once per class (walking the fields is costly)
+    return orjson.dumps(model.model_json_schema())
+
+
 class ScrapeParams(BaseModel):
     scrape_links: Annotated[
         bool,
@@ -837,28 +883,27 @@ class ScrapeParams(BaseModel):
         """
         if value is None:
             return None
-        if isinstance(value, type) and issubclass(value, BaseModel):  # type: ignore[arg-type]
-            return value
-        if not isinstance(value, dict):  # type: ignore[arg-type]
+        if not isinstance(value, dict):
+            if isinstance(value, type) and issubclass(value, BaseModel):  # type: ignore[arg-type]
+                return value
             raise ValueError(f"response_format must be a BaseModel or a dict but got: {type(value)} : {value}")  # type: ignore[unreachable]
-        if len(value.keys()) == 0:
+        if not value:
             return None
 
-        return create_model_from_schema(value)
+        try:
+            schema_key = orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            # not json serializable: can't be used as a cache key
+            return create_model_from_schema(value)
+        return _cached_model_from_schema(schema_key)
 
-    @override
-    def model_dump(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
-        dump = super().model_dump(*args, **kwargs)
-        if isinstance(self.response_format, type) and issubclass(self.response_format, BaseModel):  # pyright: ignore[reportUnnecessaryIsInstance]
-            dump["response_format"] = self.response_format.model_json_schema()
-        return dump
-
-    @override
-    def model_dump_json(self, *args: Any, **kwargs: Any) -> str:
-        dump = self.model_dump(*args, **kwargs)
-        if isinstance(self.response_format, type) and issubclass(self.response_format, BaseModel):  # pyright: ignore[reportUnnecessaryIsInstance]
-            dump["response_format"] = self.response_format.model_json_schema()
-        return json.dumps(dump)
+    @field_serializer("response_format")
+    def serialize_response_format(self, value: type[BaseModel] | None) -> dict[str, Any] | None:
+        # send the JSON schema of the model: handled by pydantic-core for both `model_dump` and `model_dump_json`
+        if value is None:
+            return None
+        # decode a fresh copy: callers may mutate the dump
+        return orjson.loads(_cached_json_schema(value))
 
 
 class ScrapeRequest(ScrapeParams):
@@ -868,6 +913,10 @@ class ScrapeRequest(ScrapeParams):
     ] = None
 
 
+# legacy step fields, superseded by `action` when it is set
+_STEP_ACTION_EXCLUDE = ("type", "action_id", "value", "enter")
+
+
 class StepRequestDict(PaginationParamsDict, total=False):
     type: str
     action_id: str | None
@@ -915,38 +964,42 @@ class StepRequest(PaginationParams):
                 raise ValueError(
                     f"Invalid action type: {self.type}. Valid types are: {BrowserAction.ACTION_REGISTRY.keys()}"
                 )
-        elif self.action_id is not None:
-            raise ValueError("action_id is not allowed when action is provided")
-        elif self.value is not None:
-            raise ValueError("value is not allowed when action is provided")
-        elif self.enter is not None:
-            raise ValueError("enter is not allowed when action is provided")
+        elif self.action_id is not None or self.value is not None or self.enter is not None:
+            # only look up which field is at fault on the error path
+            field = next(name for name in _STEP_ACTION_EXCLUDE[1:] if getattr(self, name) is not None)
+            raise ValueError(f"{field} is not allowed when action is provided")
 
     @override
     def model_dump(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
-        dump = super().model_dump(*args, **kwargs)
         if self.action is not None:
-            del dump["type"]
-            if "action_id" in dump:
-                del dump["action_id"]
-            if "value" in dump:
-                del dump["value"]
-            if "enter" in dump:
-                del dump["enter"]
-        return dump
+            # let pydantic-core skip the legacy fields rather than deleting them from the dump afterwards
+            exclude = kwargs.get("exclude")
+            if exclude is None:
+                kwargs["exclude"] = set(_STEP_ACTION_EXCLUDE)
+            elif isinstance(exclude, dict):
+                kwargs["exclude"] = {**exclude, **dict.fromkeys(_STEP_ACTION_EXCLUDE, True)}
+            else:
+                kwargs["exclude"] = {*exclude, *_STEP_ACTION_EXCLUDE}
+        return super().model_dump(*args, **kwargs)
 
 
 class ScrapeResponse(BaseModel):
+    # built on first use rather than at import: most programs only touch a few of these models
+    model_config = ConfigDict(defer_build=True)
+
     session: Annotated[SessionResponse, Field(description="Browser session information")]
     data: Annotated[DataSpace, Field(description="Data extracted from the current page")]
 
 
 class ObserveResponse(Observation):
+    model_config = ConfigDict(defer_build=True)
+
     session: Annotated[SessionResponse, Field(description="Browser session information")]
 
     @staticmethod
     def from_obs(obs: Observation, session: SessionResponse) -> "ObserveResponse":
-        return ObserveResponse(
+        # both the observation and the session are already validated models: no need to go through validation again
+        return ObserveResponse.model_construct(
             metadata=obs.metadata,
             space=obs.space,
             data=obs.data,
@@ -967,6 +1020,8 @@ class AgentStatus(StrEnum):
 
 
 class AgentSessionRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     agent_id: Annotated[str, Field(description="The ID of the agent to run")]
 
 
@@ -988,6 +1043,8 @@ class AgentStartRequestDict(AgentCreateRequestDict, AgentRunRequestDict, total=F
 
 
 class AgentCreateRequest(SessionRequest):
+    model_config = ConfigDict(defer_build=True)
+
     reasoning_model: Annotated[LlmModel, Field(description="The reasoning model to use")] = Field(
         default_factory=LlmModel.default
     )
@@ -1002,6 +1059,8 @@ class AgentCreateRequest(SessionRequest):
 
 
 class AgentRunRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     task: Annotated[str, Field(description="The task that the agent should perform")]
     url: Annotated[str | None, Field(description="The URL that the agent should start on (optional)")] = None
 
@@ -1033,6 +1092,8 @@ class AgentStopRequest(AgentSessionRequest, ReplayResponse):
 
 
 class AgentResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     agent_id: Annotated[str, Field(description="The ID of the agent")]
     created_at: Annotated[dt.datetime, Field(description="The creation time of the agent")]
     session_id: Annotated[str, Field(description="The ID of the session")]
@@ -1058,7 +1119,32 @@ class AgentStatusResponse(AgentResponse, ReplayResponse, Generic[TStepOutput]):
     steps: Annotated[
         list[TStepOutput],
         Field(description="The steps that the agent has currently taken"),
-    ] = Field(default_factory=lambda: [])
+    ] = Field(default_factory=list)
+
+
+def _agent_status_templates(colors: bool) -> tuple[str, str, str, str, str]:
+    def surround_tags(s: str, tags: tuple[str, ...] = ("b", "blue")) -> str:
+        if not colors:
+            return s
+
+        start = "".join(f"<{tag}>" for tag in tags)
+        end = "".join(f"</{tag}>" for tag in reversed(tags))
+        return f"{start}{s}{end}"
+
+    return (
+        surround_tags("📝 Current page:") + " {page_summary}",
+        surround_tags("🔬 Previous goal:") + " {emoji} {eval}",
+        surround_tags("🧠 Memory:") + " {memory}",
+        surround_tags("🎯 Next goal:") + " {goal}",
+        surround_tags("⚡ Taking action:") + "\n{action_str}",
+    )
+
+
+# templates only depend on `colors`: build them once instead of on every rendered step
+_AGENT_STATUS_TEMPLATES: dict[bool, tuple[str, str, str, str, str]] = {
+    colors: _agent_status_templates(colors) for colors in (True, False)
+}
+_AGENT_STATUS_EMOJIS: dict[str, str] = {"success": "✅", "failure": "❌"}
 
 
 def render_agent_status(
@@ -1070,31 +1156,13 @@ def render_agent_status(
     action_str: str,
     colors: bool = True,
 ) -> list[tuple[str, dict[str, str]]]:
-    status_emoji: str
-    match status:
-        case "success":
-            status_emoji = "✅"
-        case "failure":
-            status_emoji = "❌"
-        case _:
-            status_emoji = "❓"
-
-    def surround_tags(s: str, tags: tuple[str, ...] = ("b", "blue")) -> str:
-        if not colors:
-            return s
-
-        start = "".join(f"<{tag}>" for tag in tags)
-        end = "".join(f"</{tag}>" for tag in reversed(tags))
-        return f"{start}{s}{end}"
-
+    status_emoji = _AGENT_STATUS_EMOJIS.get(status, "❓")
+    page_tpl, goal_tpl, memory_tpl, next_goal_tpl, action_tpl = _AGENT_STATUS_TEMPLATES[colors]
     to_log: list[tuple[str, dict[str, str]]] = [
-        (surround_tags("📝 Current page:") + " {page_summary}", dict(page_summary=summary)),
-        (
-            surround_tags("🔬 Previous goal:") + " {emoji} {eval}",
-            dict(emoji=status_emoji, eval=goal_eval),
-        ),
-        (surround_tags("🧠 Memory:") + " {memory}", dict(memory=memory)),
-        (surround_tags("🎯 Next goal:") + " {goal}", dict(goal=next_goal)),
-        (surround_tags("⚡ Taking action:") + "\n{action_str}", dict(action_str=action_str)),
+        (page_tpl, dict(page_summary=summary)),
+        (goal_tpl, dict(emoji=status_emoji, eval=goal_eval)),
+        (memory_tpl, dict(memory=memory)),
+        (next_goal_tpl, dict(goal=next_goal)),
+        (action_tpl, dict(action_str=action_str)),
     ]
     return to_log
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import time
 from collections.abc import Sequence
-from typing import Unpack, final
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, cached_property, lru_cache
+from typing import ClassVar, Unpack, final
 
+import requests
+from loguru import logger
 from notte_core.common.resource import SyncResource
 from notte_core.credentials.base import (
     BaseVault,
@@ -45,26 +50,43 @@ from notte_sdk.types import (
     VaultCreateRequest,
     VaultCreateRequestDict,
     VaultCreateResponse,
+    _cached_root_domain,  # pyright: ignore[reportPrivateUsage]
 )
 
 
+MAX_CONCURRENT_VAULT_REQUESTS = 8
+
+
+@cache
+def _vaults_executor() -> ThreadPoolExecutor:
+    # shared by all clients so that concurrent vault requests are bounded process-wide
+    return ThreadPoolExecutor(max_workers=MAX_CONCURRENT_VAULT_REQUESTS, thread_name_prefix="notte-vaults")
+
+
 # DEFINED HERE TO SIMPLIFY CIRCULAR DEPENDENCY
 # SHOULD ONLY BE INVOKED FROM ENDPOINT ANYWAY
 @final
 class NotteVault(BaseVault, SyncResource):
     """Vault that fetches credentials stored using the sdk"""
 
+    CREDENTIALS_TTL_SECONDS: ClassVar[float] = 60.0
+
     def __init__(self, vault_id: str, vault_client: VaultsClient | None = None):
         super().__init__()
         if len(vault_id) == 0:
             raise ValueError("Vault ID cannot be empty")
 
         self.vault_id: str = vault_id
+        self._vault_client: VaultsClient | None = vault_client
+        # root domain -> (fetch time, credentials): agents typically look up the same website several times
+        self._credentials_cache: dict[str, tuple[float, CredentialsDict]] = {}
 
-        if vault_client is None:
-            vault_client = VaultsClient()
-
-        self.vault_client = vault_client
+    @cached_property
+    def vault_client(self) -> VaultsClient:
+        # only build a default client (api key lookup, http session) once the vault actually makes a request
+        if self._vault_client is not None:
+            return self._vault_client
+        return VaultsClient()
 
     @override
     def start(self) -> None:
@@ -72,19 +94,76 @@ class NotteVault(BaseVault, SyncResource):
 
     @override
     def stop(self) -> None:
-        self.delete()
+        try:
+            self.delete()
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """
+        Release the HTTP connections of the default client built by this vault, if any.
+
+        A no-op when the client was provided by the caller, which remains responsible for closing it.
+        """
+        # `cached_property` stores the built client in the instance dict: only close what we built ourselves
+        client: VaultsClient | None = self.__dict__.pop("vault_client", None)
+        if client is not None and client is not self._vault_client:
+            client.close()
+
+    def _invalidate_credentials(self, url: str) -> None:
+        _ = self._credentials_cache.pop(_cached_root_domain(url), None)
 
     @override
     def _add_credentials(self, url: str, creds: CredentialsDict) -> None:
         _ = self.vault_client.add_or_update_credentials(self.vault_id, url=url, **creds)
+        self._invalidate_credentials(url)
 
     @override
     def _get_credentials_impl(self, url: str) -> CredentialsDict | None:
-        return self.vault_client.get_credentials(vault_id=self.vault_id, url=url).credentials
+        # credentials are stored per root domain (cf `validate_url`): cache them the same way
+        domain = _cached_root_domain(url)
+        cached = self._credentials_cache.get(domain)
+        if cached is not None and time.monotonic() - cached[0] <= self.CREDENTIALS_TTL_SECONDS:
+            return cached[1].copy()
+        credentials = self.vault_client.get_credentials(vault_id=self.vault_id, url=url).credentials
+        if len(domain) > 0:
+            self._credentials_cache[domain] = (time.monotonic(), credentials.copy())
+        return credentials
+
+    def prefetch(self, urls: Sequence[str]) -> None:
+        """
+        Fetch the credentials of several websites concurrently, so that later lookups are served from the cache.
+
+        Failed lookups (e.g. no credentials stored for a website) are logged and skipped: they are simply
+        fetched again on first use.
+
+        Args:
+            urls: The urls to fetch credentials for. Urls whose credentials are already cached are skipped.
+        """
+        now = time.monotonic()
+        missing: dict[str, str] = {}
+        for url in urls:
+            domain = _cached_root_domain(url)
+            cached = self._credentials_cache.get(domain)
+            if len(domain) > 0 and (cached is None or now - cached[0] > self.CREDENTIALS_TTL_SECONDS):
+                missing.setdefault(domain, url)
+        # best-effort warm-up: one website without stored credentials must not discard the others
+        futures = {
+            domain: _vaults_executor().submit(self.vault_client.get_credentials, self.vault_id, url=url)
+            for domain, url in missing.items()
+        }
+        for domain, future in futures.items():
+            try:
+                response = future.result()
+            except Exception as e:
+                logger.debug(f"[Vault] Could not prefetch credentials for {domain}: {e}")
+                continue
+            self._credentials_cache[domain] = (time.monotonic(), response.credentials)
 
     @override
     def delete_credentials(self, url: str) -> None:
         _ = self.vault_client.delete_credentials(vault_id=self.vault_id, url=url)
+        self._invalidate_credentials(url)
 
     @override
     def set_credit_card(self, **kwargs: Unpack[CreditCardDict]) -> None:
@@ -104,6 +183,7 @@ class NotteVault(BaseVault, SyncResource):
 
     def delete(self) -> None:
         _ = self.vault_client.delete_vault(self.vault_id)
+        self._credentials_cache.clear()
 
 
 @final
@@ -128,6 +208,7 @@ class VaultsClient(BaseClient):
     DELETE_VAULT = "{vault_id}"
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def delete_vault_endpoint(vault_id: str) -> NotteEndpoint[DeleteVaultResponse]:
         """
         Returns a NotteEndpoint configured for deleting a vault.
@@ -145,6 +226,7 @@ class VaultsClient(BaseClient):
         )
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def list_credentials_endpoint(vault_id: str) -> NotteEndpoint[ListCredentialsResponse]:
         """
         Returns a NotteEndpoint configured for listing credentials in a vault.
@@ -162,6 +244,7 @@ class VaultsClient(BaseClient):
         )
 
     @staticmethod
+    @cache
     def list_endpoint() -> NotteEndpoint[ListVaultsResponse]:
         """
         Returns a NotteEndpoint configured for listing all vaults.
@@ -176,6 +259,7 @@ class VaultsClient(BaseClient):
         )
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def delete_credit_card_endpoint(vault_id: str) -> NotteEndpoint[DeleteCreditCardResponse]:
         """
         Returns a NotteEndpoint configured for deleting a credit card from a vault.
@@ -193,6 +277,7 @@ class VaultsClient(BaseClient):
         )
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def get_credit_card_endpoint(vault_id: str) -> NotteEndpoint[GetCreditCardResponse]:
         """
         Returns a NotteEndpoint configured for retrieving a credit card from a vault.
@@ -210,6 +295,7 @@ class VaultsClient(BaseClient):
         )
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def set_credit_card_endpoint(vault_id: str) -> NotteEndpoint[AddCreditCardResponse]:
         """
         Returns a NotteEndpoint configured for setting a credit card in a vault.
@@ -227,6 +313,7 @@ class VaultsClient(BaseClient):
         )
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def delete_credentials_endpoint(vault_id: str) -> NotteEndpoint[DeleteCredentialsResponse]:
         """
         Returns a NotteEndpoint configured for deleting credentials from a vault.
@@ -244,6 +331,7 @@ class VaultsClient(BaseClient):
         )
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def get_credential_endpoint(vault_id: str) -> NotteEndpoint[GetCredentialsResponse]:
         """
         Returns a NotteEndpoint configured for retrieving credentials from a vault.
@@ -261,6 +349,7 @@ class VaultsClient(BaseClient):
         )
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def add_or_update_credentials_endpoint(vault_id: str) -> NotteEndpoint[AddCredentialsResponse]:
         """
         Returns a NotteEndpoint configured for adding or updating credentials in a vault.
@@ -281,15 +370,17 @@ class VaultsClient(BaseClient):
         self,
         api_key: str | None = None,
         verbose: bool = False,
+        http: requests.Session | None = None,
     ):
         """
         Initialize a VaultsClient instance.
 
         Initializes the client with an optional API key for vault management.
         """
-        super().__init__(base_endpoint_path="vaults", api_key=api_key, verbose=verbose)
+        super().__init__(base_endpoint_path="vaults", api_key=api_key, verbose=verbose, http=http)
 
     @staticmethod
+    @cache
     def create_vault_endpoint() -> NotteEndpoint[VaultCreateResponse]:
         """
         Returns a NotteEndpoint configured for creating a new vault.
@@ -305,11 +396,12 @@ class VaultsClient(BaseClient):
 
     @override
     @staticmethod
+    @cache
     def endpoints() -> Sequence[NotteEndpoint[BaseModel]]:
         """Returns the available vault endpoints.
 
         Aggregates endpoints from VaultsClient for creating vaults, reading creds, etc..."""
-        return [
+        return (
             VaultsClient.create_vault_endpoint(),
             VaultsClient.add_or_update_credentials_endpoint(""),
             VaultsClient.get_credential_endpoint(""),
@@ -320,7 +412,7 @@ class VaultsClient(BaseClient):
             VaultsClient.list_endpoint(),
             VaultsClient.list_credentials_endpoint(""),
             VaultsClient.delete_vault_endpoint(""),
-        ]
+        )
 
     def get(self, vault_id: str) -> NotteVault:
         """
@@ -344,7 +436,7 @@ class VaultsClient(BaseClient):
         Returns:
             NotteVault: The created vault
         """
-        params = VaultCreateRequest.model_validate(data)
+        params = VaultCreateRequest.model_construct(**data)
         response = self.request(VaultsClient.create_vault_endpoint().with_request(params))
         return NotteVault(response.vault_id, vault_client=self)
 
@@ -380,6 +472,25 @@ class VaultsClient(BaseClient):
         response = self.request(self.get_credential_endpoint(vault_id).with_params(params))
         return response
 
+    def get_credentials_many(self, vault_id: str, urls: Sequence[str]) -> list[GetCredentialsResponse]:
+        """
+        Retrieves the credentials of several urls from a vault concurrently.
+
+        Requests are issued from a shared thread pool, reusing the client's connection pool.
+
+        Args:
+            vault_id: ID of the vault containing the credentials.
+            urls: The urls to retrieve credentials for.
+
+        Returns:
+            list[GetCredentialsResponse]: The responses, in the same order as `urls`.
+
+        Raises:
+            Exception: The error of the first failing url (in `urls` order): this is all-or-nothing, use
+                `NotteVault.prefetch` for a best-effort variant.
+        """
+        return list(_vaults_executor().map(lambda url: self.get_credentials(vault_id, url=url), urls))
+
     def delete_credentials(
         self, vault_id: str, **data: Unpack[DeleteCredentialsRequestDict]
     ) -> DeleteCredentialsResponse:
@@ -408,7 +519,7 @@ class VaultsClient(BaseClient):
         Returns:
             DeleteVaultResponse: Response from the delete vault endpoint.
         """
-        params = DeleteVaultRequest.model_validate(data)
+        params = DeleteVaultRequest.model_construct(**data)
         response = self.request(self.delete_vault_endpoint(vault_id).with_params(params))
         return response
 
@@ -423,7 +534,7 @@ class VaultsClient(BaseClient):
         Returns:
             ListCredentialsResponse: Response containing the list of credentials.
         """
-        params = ListCredentialsRequest.model_validate(data)
+        params = ListCredentialsRequest.model_construct(**data)
         response = self.request(self.list_credentials_endpoint(vault_id).with_params(params))
         return response
 
@@ -437,7 +548,7 @@ class VaultsClient(BaseClient):
         Returns:
             ListVaultsResponse: Response containing the list of vaults.
         """
-        params = ListVaultsRequest.model_validate(data)
+        params = ListVaultsRequest.model_construct(**data)
         response = self.request(self.list_endpoint().with_params(params))
         return response
 
@@ -454,7 +565,7 @@ class VaultsClient(BaseClient):
         Returns:
             DeleteCreditCardResponse: Response from the delete credit card endpoint.
         """
-        params = DeleteCreditCardRequest.model_validate(data)
+        params = DeleteCreditCardRequest.model_construct(**data)
         response = self.request(self.delete_credit_card_endpoint(vault_id).with_params(params))
         return response
 
@@ -469,7 +580,7 @@ class VaultsClient(BaseClient):
         Returns:
             GetCreditCardResponse: Response containing the requested credit card information.
         """
-        params = GetCreditCardRequest.model_validate(data)
+        params = GetCreditCardRequest.model_construct(**data)
         response = self.request(self.get_credit_card_endpoint(vault_id).with_params(params))
         return response
 
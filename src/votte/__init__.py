@@ -1,8 +1,37 @@
-from notte_agent.main import Agent
-from notte_browser.session import NotteSession as Session
-from notte_core import check_notte_version, set_error_mode
-from notte_sdk.client import NotteClient
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from notte_core import check_notte_version
+
+if TYPE_CHECKING:
+    from notte_agent.main import Agent
+    from notte_browser.session import NotteSession as Session
+    from notte_core import set_error_mode
+    from notte_sdk.client import NotteClient
+
+# exports are resolved on first access (PEP 562): `import votte` alone doesn't pull in
+# the agent/browser/sdk stacks and build all their pydantic schemas
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "NotteClient": ("notte_sdk.client", "NotteClient"),
+    "Session": ("notte_browser.session", "NotteSession"),
+    "Agent": ("notte_agent.main", "Agent"),
+    "set_error_mode": ("notte_core", "set_error_mode"),
+}
 
 __version__ = check_notte_version("notte")
 
 __all__ = ["NotteClient", "Session", "Agent", "set_error_mode"]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module, attr = _LAZY_EXPORTS[name]
+    value = getattr(import_module(module), attr)
+    # cache in the module namespace: later accesses don't go through `__getattr__` anymore
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
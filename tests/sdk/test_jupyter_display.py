@@ -0,0 +1,73 @@
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+from notte_sdk.websockets import jupyter
+from notte_sdk.websockets.jupyter import WebsocketJupyterDisplay
+
+
+class _FakeWebsocket:
+    def __init__(self, messages: list[bytes]) -> None:
+        self.messages = messages
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self._iter()
+
+    async def _iter(self) -> AsyncIterator[bytes]:
+        for message in self.messages:
+            yield message
+
+
+class _FakeConnect:
+    """Stands in for `websockets.client.connect(...)`: errors surface when the connection is opened."""
+
+    def __init__(self, outcome: BaseException | _FakeWebsocket) -> None:
+        self.outcome = outcome
+
+    async def __aenter__(self) -> _FakeWebsocket:
+        if isinstance(self.outcome, BaseException):
+            raise self.outcome
+        return self.outcome
+
+    async def __aexit__(self, *args: object) -> None:
+        return None
+
+
+@pytest.mark.asyncio
+async def test_connect_retries_refused_reconnect(monkeypatch: pytest.MonkeyPatch) -> None:
+    outcomes: list[BaseException | _FakeWebsocket] = [
+        ConnectionRefusedError("connection refused"),
+        _FakeWebsocket([b"frame-1", b"frame-2"]),
+    ]
+    calls: list[str] = []
+
+    def fake_connect(url: str, **kwargs: Any) -> _FakeConnect:
+        calls.append(url)
+        return _FakeConnect(outcomes.pop(0))
+
+    monkeypatch.setattr(jupyter.websockets.client, "connect", fake_connect)
+    monkeypatch.setattr(WebsocketJupyterDisplay, "RECONNECT_BASE_DELAY_SECONDS", 0.0)
+
+    display = WebsocketJupyterDisplay(wss_url="wss://example.com/recording")
+    frames = [frame async for frame in display.connect()]
+
+    assert frames == [b"frame-1", b"frame-2"]
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_connect_gives_up_after_max_reconnect_attempts(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+
+    def fake_connect(url: str, **kwargs: Any) -> _FakeConnect:
+        calls.append(url)
+        return _FakeConnect(ConnectionRefusedError("connection refused"))
+
+    monkeypatch.setattr(jupyter.websockets.client, "connect", fake_connect)
+    monkeypatch.setattr(WebsocketJupyterDisplay, "RECONNECT_BASE_DELAY_SECONDS", 0.0)
+
+    display = WebsocketJupyterDisplay(wss_url="wss://example.com/recording")
+    frames = [frame async for frame in display.connect()]
+
+    assert frames == []
+    assert len(calls) == WebsocketJupyterDisplay.MAX_RECONNECT_ATTEMPTS + 1